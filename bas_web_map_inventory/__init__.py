@@ -1,25 +1,70 @@
 import os
+import atexit
 
-import sentry_sdk
-
+from functools import lru_cache
 from logging import Formatter
-from logging.handlers import RotatingFileHandler
-from typing import Dict, Any
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Dict, Any, Type, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+# Throughout this package, dependencies that are slow to import and only needed by some commands or features (e.g. the
+# GeoServer, OWS and Airtable clients, lxml, JSON Schema, Inquirer and Sentry) are imported within the functions that
+# use them, rather than at module level, so that each command only pays the import cost of what it uses.
+
+
+@lru_cache(maxsize=None)
+def _get_app_config_class(environment: str) -> Type:
+    """
+    Resolves the class defined in config.py for an application environment (e.g. production)
+
+    The set of config classes is small and fixed, so the (dotted path) import is only performed once per environment.
+
+    :param environment: application environment name, typically from the FLASK_ENV environment variable
+    :return: config class for the application environment
+    """
+    # noinspection PyPackageRequirements
+    from werkzeug.utils import import_string
+
+    return import_string(f"bas_web_map_inventory.config.{environment.capitalize()}Config")
+
 
-from flask import Flask, logging as flask_logging
-from flask.cli import AppGroup
+@lru_cache(maxsize=None)
+def _get_log_formatter(log_format: str) -> Formatter:
+    """
+    Creates a log formatter for a log format, shared between log handlers (and apps) using the same format
+
+    :param log_format: log record format string (e.g. as set by the LOG_FORMAT config option)
+    :return: log formatter
+    """
+    return Formatter(log_format)
 
-# noinspection PyPackageRequirements
-from werkzeug.utils import import_string
 
-from bas_web_map_inventory.cli import (
-    version as version_cmd,
-    fetch as data_fetch_cmd,
-    validate as data_validate_cmd,
-    status as airtable_status_cmd,
-    sync as airtable_sync_cmd,
-    reset as airtable_reset_cmd,
-)
+@lru_cache(maxsize=None)
+def _get_file_log_queue(log_file_path: str, logging_level: Union[int, str], log_format: str) -> SimpleQueue:
+    """
+    Creates a queue for log records to be written to a log file, shared between apps using the same log file
+
+    Records added to the queue are written to the log file from a separate thread, as commands can log many records
+    (e.g. for each layer). The listener for this thread is started once per log file and stopped on exit.
+
+    :param log_file_path: path to the log file (e.g. as set by the LOG_FILE_PATH config option)
+    :param logging_level: minimum level of records to write to the log file
+    :param log_format: log record format string (e.g. as set by the LOG_FORMAT config option)
+    :return: log record queue
+    """
+    file_log = RotatingFileHandler(log_file_path, maxBytes=5242880, backupCount=5)
+    file_log.setLevel(logging_level)
+    file_log.setFormatter(_get_log_formatter(log_format=log_format))
+
+    file_log_queue: SimpleQueue = SimpleQueue()
+    file_log_listener = QueueListener(file_log_queue, file_log, respect_handler_level=True)
+    file_log_listener.start()
+    atexit.register(file_log_listener.stop)
+
+    return file_log_queue
 
 
 def _create_app_config() -> Dict[str, Any]:
@@ -32,10 +77,10 @@ def _create_app_config() -> Dict[str, Any]:
 
     :return: object for a Flask app's configuration
     """
-    return import_string(f"bas_web_map_inventory.config.{str(os.environ['FLASK_ENV']).capitalize()}Config")()
+    return _get_app_config_class(environment=str(os.environ["FLASK_ENV"]))()
 
 
-def create_app() -> Flask:
+def create_app() -> "Flask":
     """
     Flask app factory
 
@@ -46,22 +91,42 @@ def create_app() -> Flask:
 
     :return: Flask application instance
     """
+    # Flask, Click and CLI commands are imported here, rather than when this package is imported, so that components
+    # (e.g. `bas_web_map_inventory.components`) can be used without loading the web framework
+    from flask import Flask, logging as flask_logging
+    from flask.cli import AppGroup
+
+    from bas_web_map_inventory.cli import (
+        version as version_cmd,
+        fetch as data_fetch_cmd,
+        validate as data_validate_cmd,
+        status as airtable_status_cmd,
+        sync as airtable_sync_cmd,
+        reset as airtable_reset_cmd,
+    )
+
     app = Flask(__name__)
 
     app.config.from_object(_create_app_config())
 
     if "LOGGING_LEVEL" in app.config:
         app.logger.setLevel(app.config["LOGGING_LEVEL"])
-        flask_logging.default_handler.setFormatter(Formatter(app.config["LOG_FORMAT"]))
+        flask_logging.default_handler.setFormatter(_get_log_formatter(log_format=app.config["LOG_FORMAT"]))
     if app.config["APP_ENABLE_FILE_LOGGING"]:
-        file_log = RotatingFileHandler(app.config["LOG_FILE_PATH"], maxBytes=5242880, backupCount=5)
-        file_log.setLevel(app.config["LOGGING_LEVEL"])
-        file_log.setFormatter(Formatter(app.config["LOG_FORMAT"]))
-        app.logger.addHandler(file_log)
+        file_log_queue = _get_file_log_queue(
+            log_file_path=app.config["LOG_FILE_PATH"],
+            logging_level=app.config["LOGGING_LEVEL"],
+            log_format=app.config["LOG_FORMAT"],
+        )
+        app.logger.addHandler(QueueHandler(file_log_queue))
 
     if app.config["APP_ENABLE_SENTRY"]:
+        import sentry_sdk
+
         app.logger.info("Sentry error reporting enabled")
-        sentry_sdk.init(**app.config["SENTRY_CONFIG"])
+        # Sentry is only initialised once per process, as apps may be created multiple times (e.g. by the reloader)
+        if sentry_sdk.Hub.current.client is None:
+            sentry_sdk.init(**app.config["SENTRY_CONFIG"])
 
     app.logger.info(f"{app.config['NAME']} ({app.config['VERSION']}) [{app.config['ENV']}]")
 
@@ -1,23 +1,16 @@
 import json
 
-# noinspection PyPackageRequirements
-import ulid
-import inquirer
-
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 from importlib import resources
 
 from flask import current_app as app
 from flask.cli import with_appcontext
-from jsonschema import validate as jsonschema_validate, ValidationError
 
 # noinspection PyPackageRequirements
 from click import command, option, echo, confirm, style as click_style, Path as ClickPath, Choice, Abort
 
-# noinspection PyPackageRequirements
-from airtable import Airtable as _Airtable
-
 from bas_web_map_inventory.components import (
     Server,
     Servers,
@@ -48,6 +41,21 @@ from bas_web_map_inventory.utils import OGCProtocol, validate_ogc_capabilities,
 # Utils
 
 
+# Maximum number of servers to fetch components from at the same time (each server may make concurrent requests too)
+_FETCH_SERVER_WORKERS = 4
+
+# Airtable component collections (keys in the 'airtable' app config option) and labels, in the order they're processed
+# (as components link to components earlier in this list)
+_AIRTABLE_COMPONENTS: List[Tuple[str, str]] = [
+    ("servers", "Servers"),
+    ("namespaces", "Namespaces (Workspaces)"),
+    ("repositories", "Repositories (Stores)"),
+    ("styles", "Styles"),
+    ("layers", "Layers"),
+    ("layer_groups", "Layer Groups"),
+]
+
+
 def _load_data_sources_interactive(data_sources_file_path: Path) -> List[Dict[str, str]]:
     """
     Shared method for loading and validating data sources from a configuration file
@@ -57,8 +65,10 @@ def _load_data_sources_interactive(data_sources_file_path: Path) -> List[Dict[st
     :param data_sources_file_path: file path to a data sources file
     :return: list of data source dictionaries
     """
+    from jsonschema import validate as jsonschema_validate, ValidationError
+
     echo(f"Loading sources from {click_style(str(data_sources_file_path), fg='blue')}")
-    with open(Path(data_sources_file_path), "r") as data_sources_file:
+    with open(data_sources_file_path, "rb") as data_sources_file:
         data_sources_data = data_sources_file.read()
     try:
         data_sources = json.loads(data_sources_data)
@@ -101,9 +111,11 @@ def _load_data(data_file_path: Path) -> None:
     :param data_file_path:
     :return:
     """
+    from jsonschema import validate as jsonschema_validate, ValidationError
+
     app.logger.info(f"Loading data from {str(data_file_path.absolute())} ...")
 
-    with open(Path(data_file_path), "r") as data_file:
+    with open(data_file_path, "rb") as data_file:
         _data = data_file.read()
     try:
         data = json.loads(_data)
@@ -133,96 +145,101 @@ def _load_data(data_file_path: Path) -> None:
             )
             raise ValueError(f"{str(data_file_path.absolute())} does not validate against JSON schema")
 
-    servers = Servers()
-    for server in data["servers"]:
-        server = Server(
-            server_id=server["id"],
-            label=server["label"],
-            hostname=server["hostname"],
-            server_type=server["type"],
-            version=server["version"],
-        )
-        servers[server.id] = server
+    servers = Servers(
+        {
+            server["id"]: Server(
+                server_id=server["id"],
+                label=server["label"],
+                hostname=server["hostname"],
+                server_type=server["type"],
+                version=server["version"],
+            )
+            for server in data["servers"]
+        }
+    )
 
-    namespaces = Namespaces()
-    for namespace in data["namespaces"]:
-        namespace = Namespace(
-            namespace_id=namespace["id"],
-            label=namespace["label"],
-            title=namespace["title"],
-            namespace=namespace["namespace"],
-            server=servers[namespace["relationships"]["servers"]],
-        )
-        namespaces[namespace.id] = namespace
+    namespaces = Namespaces(
+        {
+            namespace["id"]: Namespace(
+                namespace_id=namespace["id"],
+                label=namespace["label"],
+                title=namespace["title"],
+                namespace=namespace["namespace"],
+                server=servers[namespace["relationships"]["servers"]],
+            )
+            for namespace in data["namespaces"]
+        }
+    )
 
-    repositories = Repositories()
-    for repository in data["repositories"]:
-        repository = Repository(
-            repository_id=repository["id"],
-            label=repository["label"],
-            title=repository["title"],
-            repository_type=repository["type"],
-            hostname=repository["hostname"],
-            database=repository["database"],
-            schema=repository["schema"],
-            namespace=namespaces[repository["relationships"]["namespaces"]],
-        )
-        repositories[repository.id] = repository
+    repositories = Repositories(
+        {
+            repository["id"]: Repository(
+                repository_id=repository["id"],
+                label=repository["label"],
+                title=repository["title"],
+                repository_type=repository["type"],
+                hostname=repository["hostname"],
+                database=repository["database"],
+                schema=repository["schema"],
+                namespace=namespaces[repository["relationships"]["namespaces"]],
+            )
+            for repository in data["repositories"]
+        }
+    )
 
-    styles = Styles()
-    for style in data["styles"]:
-        _namespace = None
-        if style["relationships"]["namespaces"] is not None:
-            _namespace = namespaces[style["relationships"]["namespaces"]]
-        style = Style(
-            style_id=style["id"],
-            label=style["label"],
-            title=style["title"],
-            style_type=style["type"],
-            namespace=_namespace,
-        )
-        styles[style.id] = style
+    styles = Styles(
+        {
+            style["id"]: Style(
+                style_id=style["id"],
+                label=style["label"],
+                title=style["title"],
+                style_type=style["type"],
+                namespace=(
+                    namespaces[style["relationships"]["namespaces"]]
+                    if style["relationships"]["namespaces"] is not None
+                    else None
+                ),
+            )
+            for style in data["styles"]
+        }
+    )
 
-    layers = Layers()
-    for layer in data["layers"]:
-        _styles = []
-        for style_id in layer["relationships"]["styles"]:
-            _styles.append(styles[style_id])
-        layer = Layer(
-            layer_id=layer["id"],
-            label=layer["label"],
-            title=layer["title"],
-            layer_type=layer["type"],
-            geometry_type=layer["geometry"],
-            services=layer["services"],
-            table_view=layer["table_view"],
-            namespace=namespaces[layer["relationships"]["namespaces"]],
-            repository=repositories[layer["relationships"]["repositories"]],
-            styles=_styles,
-        )
-        layers[layer.id] = layer
-
-    layer_groups = LayerGroups()
-    for layer_group in data["layer-groups"]:
-        _namespace = None
-        if layer_group["relationships"]["namespaces"] is not None:
-            _namespace = namespaces[layer_group["relationships"]["namespaces"]]
-        _layers = []
-        for layer_id in layer_group["relationships"]["layers"]:
-            _layers.append(layers[layer_id])
-        _styles = []
-        for style_id in layer_group["relationships"]["styles"]:
-            _styles.append(styles[style_id])
-        layer_group = LayerGroup(
-            layer_group_id=layer_group["id"],
-            label=layer_group["label"],
-            title=layer_group["title"],
-            services=layer_group["services"],
-            namespace=_namespace,
-            layers=_layers,
-            styles=_styles,
-        )
-        layer_groups[layer_group.id] = layer_group
+    layers = Layers(
+        {
+            layer["id"]: Layer(
+                layer_id=layer["id"],
+                label=layer["label"],
+                title=layer["title"],
+                layer_type=layer["type"],
+                geometry_type=layer["geometry"],
+                services=layer["services"],
+                table_view=layer["table_view"],
+                namespace=namespaces[layer["relationships"]["namespaces"]],
+                repository=repositories[layer["relationships"]["repositories"]],
+                styles=[styles[style_id] for style_id in layer["relationships"]["styles"]],
+            )
+            for layer in data["layers"]
+        }
+    )
+
+    layer_groups = LayerGroups(
+        {
+            layer_group["id"]: LayerGroup(
+                layer_group_id=layer_group["id"],
+                label=layer_group["label"],
+                title=layer_group["title"],
+                services=layer_group["services"],
+                namespace=(
+                    namespaces[layer_group["relationships"]["namespaces"]]
+                    if layer_group["relationships"]["namespaces"] is not None
+                    else None
+                ),
+                layers=[layers[layer_id] for layer_id in layer_group["relationships"]["layers"]],
+                styles=[styles[style_id] for style_id in layer_group["relationships"]["styles"]],
+            )
+            for layer_group in data["layer-groups"]
+        }
+    )
 
     app.config["data"] = {
         "servers": servers,
@@ -249,6 +266,9 @@ def _setup_airtable(config: dict) -> Dict[str, Airtable]:  # pragma: no cover
     :param config: Flask configuration object containing items needed to create Airtable Component collection instances
     :return: Airtable Component collection instances
     """
+    # noinspection PyPackageRequirements
+    from airtable import Airtable as _Airtable
+
     _servers_airtable = _Airtable(
         base_key=config["AIRTABLE_BASE_ID"], api_key=config["AIRTABLE_API_KEY"], table_name="Servers"
     )
@@ -309,23 +329,21 @@ def _setup_airtable(config: dict) -> Dict[str, Airtable]:  # pragma: no cover
     }
 
 
-def _process_component_airtable_status(global_status: Dict[str, int], component_type: str) -> None:
+def _process_component_airtable_status(
+    global_status: Dict[str, int], component_type: str, refresh: bool = True
+) -> None:
     """
     Shared method to present detailed and summary sync status information for a component
 
     :param global_status: dictionary of sync states to add a components status totals to compile overall status totals
     :param component_type: name of the current component being reported
+    :param refresh: whether to recalculate the status of the component from Airtable
     """
     echo(f"Getting status for {click_style(component_type.capitalize(), fg='cyan')}:")
-    _status = app.config["airtable"][component_type].status()
-    global_status["current"] += len(_status["current"])
-    global_status["outdated"] += len(_status["outdated"])
-    global_status["missing"] += len(_status["missing"])
-    global_status["orphaned"] += len(_status["orphaned"])
-    echo(f"* current: {click_style(str(len(_status['current'])), fg='blue')}")
-    echo(f"* outdated: {click_style(str(len(_status['outdated'])), fg='blue')}")
-    echo(f"* missing: {click_style(str(len(_status['missing'])), fg='blue')}")
-    echo(f"* orphaned: {click_style(str(len(_status['orphaned'])), fg='blue')}")
+    _status = app.config["airtable"][component_type].status(refresh=refresh)
+    for state, item_ids in _status.items():
+        global_status[state] += len(item_ids)
+        echo(f"* {state}: {click_style(str(len(item_ids)), fg='blue')}")
     echo(_status)
 
 
@@ -351,6 +369,32 @@ def _make_geoserver_server(server_config: Dict[str, str]) -> GeoServer:
     )
 
 
+def _fetch_from_servers(
+    servers: Servers, component_type: str, fetch_method: Callable[[Any], List[Dict]]
+) -> Dict[str, List[Dict]]:
+    """
+    Shared method to fetch components (e.g. layers) from each server at the same time
+
+    Servers are independent of each other, so requests to different servers are made concurrently (requests for
+    components within a server may also be made concurrently, see the `get_*_detail` methods in server classes).
+
+    Results are returned per server, in the same order as the servers collection, so that they can be processed and
+    reported in a consistent order. Progress is reported for each server before any requests are made.
+
+    :param servers: servers to fetch components from
+    :param component_type: name of the type of component being fetched (e.g. 'Layers'), used in progress messages
+    :param fetch_method: method to fetch components from a server, given that server
+    :return: components fetched from each server, indexed by server identifier
+    """
+    if len(servers) == 0:
+        return {}
+
+    for server in servers.values():
+        echo(f"Fetching {click_style(component_type, fg='cyan')} in {click_style(server.label, fg='magenta')}:")
+    with ThreadPoolExecutor(max_workers=min(_FETCH_SERVER_WORKERS, len(servers))) as executor:
+        return dict(zip(servers.keys(), executor.map(fetch_method, servers.values())))
+
+
 # Commands
 
 
@@ -367,6 +411,9 @@ def version():
 @with_appcontext
 def fetch(data_sources_file_path: str, data_output_file_path: str):
     """Fetch data from data sources into a data file"""
+    # noinspection PyPackageRequirements
+    import ulid
+
     app.config["data"] = {}
 
     data_sources = _load_data_sources_interactive(data_sources_file_path=Path(data_sources_file_path))
@@ -391,19 +438,18 @@ def fetch(data_sources_file_path: str, data_output_file_path: str):
     app.config["data"]["servers"] = servers
     echo(f"* fetched {click_style(str(len(servers)), fg='blue')} servers (total)")
 
-    server_namespaces: Dict[str, List[Dict[str, str]]] = {}
-    for server in servers.values():
-        server_namespaces[server.id] = []
-        if isinstance(server, GeoServer):
-            for _namespace in server.get_namespaces():
-                server_namespaces[server.id].append(server.get_namespace(namespace_reference=_namespace))
+    server_namespaces: Dict[str, List[Dict[str, str]]] = _fetch_from_servers(
+        servers=servers,
+        component_type="Namespaces",
+        fetch_method=lambda server: (
+            server.get_namespaces_detail(namespace_references=server.get_namespaces())
+            if isinstance(server, GeoServer)
+            else []
+        ),
+    )
 
     namespaces = Namespaces()
     for server_id, _server_namespaces in server_namespaces.items():
-        echo(
-            f"Fetching {click_style('Namespaces', fg='cyan')} in "
-            f"{click_style(servers[server_id].label, fg='magenta')}:"
-        )
         for _server_namespace in _server_namespaces:
             namespace = Namespace(
                 namespace_id=ulid.new().str,
@@ -421,31 +467,35 @@ def fetch(data_sources_file_path: str, data_output_file_path: str):
     echo(f"* fetched {click_style(str(len(namespaces)), fg='blue')} namespaces (total)")
 
     repositories = Repositories()
+    server_repositories = _fetch_from_servers(
+        servers=servers,
+        component_type="Repositories",
+        fetch_method=lambda server: server.get_repositories_detail(repository_references=server.get_repositories()),
+    )
     for server in servers.values():
-        _repositories_server_count = 0
-        echo(f"Fetching {click_style('Repositories', fg='cyan')} in {click_style(server.label, fg='magenta')}:")
-        for _repository in server.get_repositories():
-            _repositories_server_count += 1
-            _repository = server.get_repository(repository_reference=_repository[0], namespace_reference=_repository[1])
+        _server_repositories = server_repositories[server.id]
+        for _repository in _server_repositories:
             _repository["repository_id"] = ulid.new().str
             _repository["namespace"] = namespaces.get_by_label(label=_repository["namespace_label"])
             del _repository["namespace_label"]
             repository = Repository(**_repository)
             repositories[repository.id] = repository
         echo(
-            f"* fetched {click_style(str(_repositories_server_count), fg='blue')} repositories for "
+            f"* fetched {click_style(str(len(_server_repositories)), fg='blue')} repositories for "
             f"{click_style(server.label, fg='magenta')}"
         )
     app.config["data"]["repositories"] = repositories
     echo(f"* fetched {click_style(str(len(repositories)), fg='blue')} repositories (total)")
 
     styles = Styles()
+    server_styles = _fetch_from_servers(
+        servers=servers,
+        component_type="Styles",
+        fetch_method=lambda server: server.get_styles_detail(style_references=server.get_styles()),
+    )
     for server in servers.values():
-        _styles_server_count = 0
-        echo(f"Fetching {click_style('Styles', fg='cyan')} in {click_style(server.label, fg='magenta')}:")
-        for _style in server.get_styles():
-            _styles_server_count += 1
-            _style = server.get_style(style_reference=_style[0], namespace_reference=_style[1])
+        _server_styles = server_styles[server.id]
+        for _style in _server_styles:
             _style["style_id"] = ulid.new().str
             if "namespace_label" in _style:
                 _style["namespace"] = namespaces.get_by_label(label=_style["namespace_label"])
@@ -453,19 +503,21 @@ def fetch(data_sources_file_path: str, data_output_file_path: str):
             style = Style(**_style)
             styles[style.id] = style
         echo(
-            f"* fetched {click_style(str(_styles_server_count), fg='blue')} styles for "
+            f"* fetched {click_style(str(len(_server_styles)), fg='blue')} styles for "
             f"{click_style(server.label, fg='magenta')}"
         )
     app.config["data"]["styles"] = styles
     echo(f"* fetched {click_style(str(len(styles)), fg='blue')} styles (total)")
 
     layers = Layers()
+    server_layers = _fetch_from_servers(
+        servers=servers,
+        component_type="Layers",
+        fetch_method=lambda server: server.get_layers_detail(layer_references=server.get_layers()),
+    )
     for server in servers.values():
-        _layers_server_count = 0
-        echo(f"Fetching {click_style('Layers', fg='cyan')} in {click_style(server.label, fg='magenta')}:")
-        for _layer in server.get_layers():
-            _layers_server_count += 1
-            _layer = server.get_layer(layer_reference=_layer)
+        _server_layers = server_layers[server.id]
+        for _layer in _server_layers:
             _layer["layer_id"] = ulid.new().str
             _layer["namespace"] = namespaces.get_by_label(label=_layer["namespace_label"])
             _layer["repository"] = repositories.get_by_label(label=_layer["repository_label"])
@@ -478,21 +530,21 @@ def fetch(data_sources_file_path: str, data_output_file_path: str):
             layer = Layer(**_layer)
             layers[layer.id] = layer
         echo(
-            f"* fetched {click_style(str(_layers_server_count), fg='blue')} layers for "
+            f"* fetched {click_style(str(len(_server_layers)), fg='blue')} layers for "
             f"{click_style(server.label, fg='magenta')}"
         )
     app.config["data"]["layers"] = layers
     echo(f"* fetched {click_style(str(len(layers)), fg='blue')} layers (total)")
 
     layer_groups = Layers()
+    server_layer_groups = _fetch_from_servers(
+        servers=servers,
+        component_type="Layer Groups",
+        fetch_method=lambda server: server.get_layer_groups_detail(layer_group_references=server.get_layer_groups()),
+    )
     for server in servers.values():
-        _layer_groups_server_count = 0
-        echo(f"Fetching {click_style('Layer Groups', fg='cyan')} in {click_style(server.label, fg='magenta')}:")
-        for _layer_group in server.get_layer_groups():
-            _layer_groups_server_count += 1
-            _layer_group = server.get_layer_group(
-                layer_group_reference=_layer_group[0], namespace_reference=_layer_group[1]
-            )
+        _server_layer_groups = server_layer_groups[server.id]
+        for _layer_group in _server_layer_groups:
             _layer_group["layer_group_id"] = ulid.new().str
             _layer_group["namespace"] = namespaces.get_by_label(label=_layer_group["namespace_label"])
             _layer_group["layers"] = []
@@ -511,14 +563,15 @@ def fetch(data_sources_file_path: str, data_output_file_path: str):
             layer_group = LayerGroup(**_layer_group)
             layer_groups[layer_group.id] = layer_group
         echo(
-            f"* fetched {click_style(str(_layer_groups_server_count), fg='blue')} layer groups for "
+            f"* fetched {click_style(str(len(_server_layer_groups)), fg='blue')} layer groups for "
             f"{click_style(server.label, fg='magenta')}"
         )
     app.config["data"]["layer_groups"] = layer_groups
     echo(f"* fetched {click_style(str(len(layer_groups)), fg='blue')} layer groups (total)")
 
     echo(f"")
-    echo(f"Saving fetched data to {click_style(str(Path(data_output_file_path).absolute()), fg='blue')}")
+    data_output_path = Path(data_output_file_path)
+    echo(f"Saving fetched data to {click_style(str(data_output_path.absolute()), fg='blue')}")
     _data = {
         "servers": servers.to_list(),
         "namespaces": namespaces.to_list(),
@@ -527,8 +580,8 @@ def fetch(data_sources_file_path: str, data_output_file_path: str):
         "layers": layers.to_list(),
         "layer-groups": layer_groups.to_list(),
     }
-    with open(Path(data_output_file_path), "w") as data_file:
-        json.dump(_data, data_file, indent=4)
+    # Data is encoded in one go and written as bytes with a single call, bypassing text encoding and buffering layers
+    data_output_path.write_bytes(json.dumps(_data, indent=4).encode())
     echo(click_style("Fetch complete", fg="green"))
 
 
@@ -539,6 +592,7 @@ def fetch(data_sources_file_path: str, data_output_file_path: str):
 @with_appcontext
 def validate(data_sources_file_path: str, data_source_identifier: str = None, validation_protocol: str = None):
     """Validate a data feed for a data source defined in a data sources file"""
+    import inquirer
 
     data_sources = _load_data_sources_interactive(data_sources_file_path=Path(data_sources_file_path))
     echo("")
@@ -608,24 +662,21 @@ def status(data_input_file_path: str):
     """Get status of all components in Airtable."""
     if "data" not in app.config:
         _load_data(data_file_path=Path(data_input_file_path))
+    # Airtable collections calculate their status when created, so only existing collections need recalculating
+    refresh = True
     if "airtable" not in app.config:
         app.config["airtable"] = _setup_airtable(config=app.config)
+        refresh = False
 
     _global_status = {"current": 0, "outdated": 0, "missing": 0, "orphaned": 0}
 
-    _process_component_airtable_status(global_status=_global_status, component_type="servers")
-    _process_component_airtable_status(global_status=_global_status, component_type="namespaces")
-    _process_component_airtable_status(global_status=_global_status, component_type="repositories")
-    _process_component_airtable_status(global_status=_global_status, component_type="styles")
-    _process_component_airtable_status(global_status=_global_status, component_type="layers")
-    _process_component_airtable_status(global_status=_global_status, component_type="layer_groups")
+    for component_type, _ in _AIRTABLE_COMPONENTS:
+        _process_component_airtable_status(global_status=_global_status, component_type=component_type, refresh=refresh)
 
     echo("")
     echo("Status summary:")
-    echo(f"* current (total): {click_style(str(_global_status['current']), fg='blue')}")
-    echo(f"* outdated (total): {click_style(str(_global_status['outdated']), fg='blue')}")
-    echo(f"* missing (total): {click_style(str(_global_status['missing']), fg='blue')}")
-    echo(f"* orphaned (total): {click_style(str(_global_status['orphaned']), fg='blue')}")
+    for state, count in _global_status.items():
+        echo(f"* {state} (total): {click_style(str(count), fg='blue')}")
     echo(click_style("Status complete", fg="green"))
 
 
@@ -639,30 +690,12 @@ def sync(data_input_file_path: str):
     if "airtable" not in app.config:
         app.config["airtable"] = _setup_airtable(config=app.config)
 
-    echo(f"Syncing {click_style('Servers', fg='yellow')}:")
-    echo(app.config["airtable"]["servers"].status())
-    app.config["airtable"]["servers"].sync()
-    echo(app.config["airtable"]["servers"].status())
-    echo(f"Syncing {click_style('Namespaces (Workspaces)', fg='yellow')}:")
-    echo(app.config["airtable"]["namespaces"].status())
-    app.config["airtable"]["namespaces"].sync()
-    echo(app.config["airtable"]["namespaces"].status())
-    echo(f"Syncing {click_style('Repositories (Stores)', fg='yellow')}:")
-    echo(app.config["airtable"]["repositories"].status())
-    app.config["airtable"]["repositories"].sync()
-    echo(app.config["airtable"]["repositories"].status())
-    echo(f"Syncing {click_style('Styles', fg='yellow')}:")
-    echo(app.config["airtable"]["styles"].status())
-    app.config["airtable"]["styles"].sync()
-    echo(app.config["airtable"]["styles"].status())
-    echo(f"Syncing {click_style('Layers', fg='yellow')}:")
-    echo(app.config["airtable"]["layers"].status())
-    app.config["airtable"]["layers"].sync()
-    echo(app.config["airtable"]["layers"].status())
-    echo(f"Syncing {click_style('Layer Groups', fg='yellow')}:")
-    echo(app.config["airtable"]["layer_groups"].status())
-    app.config["airtable"]["layer_groups"].sync()
-    echo(app.config["airtable"]["layer_groups"].status())
+    for component_type, component_label in _AIRTABLE_COMPONENTS:
+        collection = app.config["airtable"][component_type]
+        echo(f"Syncing {click_style(component_label, fg='yellow')}:")
+        echo(collection.status())
+        collection.sync()
+        echo(collection.status())
 
 
 @command()
@@ -677,21 +710,8 @@ def reset(data_input_file_path: str):
     if "airtable" not in app.config:
         app.config["airtable"] = _setup_airtable(config=app.config)
 
-    echo(f"Resetting {click_style('Servers', fg='red')}:")
-    app.config["airtable"]["servers"].reset()
-    echo(app.config["airtable"]["servers"].status())
-    echo(f"Resetting {click_style('Namespaces (Workspaces)', fg='red')}:")
-    app.config["airtable"]["namespaces"].reset()
-    echo(app.config["airtable"]["namespaces"].status())
-    echo(f"Resetting {click_style('Repositories (Stores)', fg='red')}:")
-    app.config["airtable"]["repositories"].reset()
-    echo(app.config["airtable"]["repositories"].status())
-    echo(f"Resetting {click_style('Styles', fg='red')}:")
-    app.config["airtable"]["styles"].reset()
-    echo(app.config["airtable"]["styles"].status())
-    echo(f"Resetting {click_style('Layers', fg='red')}:")
-    app.config["airtable"]["layers"].reset()
-    echo(app.config["airtable"]["layers"].status())
-    echo(f"Resetting {click_style('Layer Groups', fg='red')}:")
-    app.config["airtable"]["layer_groups"].reset()
-    echo(app.config["airtable"]["layer_groups"].status())
+    for component_type, component_label in _AIRTABLE_COMPONENTS:
+        collection = app.config["airtable"][component_type]
+        echo(f"Resetting {click_style(component_label, fg='red')}:")
+        collection.reset()
+        echo(collection.status())
@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import Dict, List, Optional, Union, Any
+from operator import methodcaller
+from typing import Dict, List, Optional, Union, Any, Tuple
 
 
 class ServerType(Enum):
@@ -84,6 +85,21 @@ class LayerGroupService(Enum):
     WFS = "wfs"
 
 
+# Lookup tables for enumeration members by value, used when creating components in bulk as these are considerably
+# quicker than calling the enumeration (e.g. `LayerService("wms")`) for each value.
+_SERVER_TYPES: Dict[str, ServerType] = {member.value: member for member in ServerType}
+_REPOSITORY_TYPES: Dict[str, RepositoryType] = {member.value: member for member in RepositoryType}
+_STYLE_TYPES: Dict[str, StyleType] = {member.value: member for member in StyleType}
+_LAYER_TYPES: Dict[str, LayerType] = {member.value: member for member in LayerType}
+_LAYER_GEOMETRIES: Dict[str, LayerGeometry] = {member.value: member for member in LayerGeometry}
+_LAYER_SERVICES: Dict[str, LayerService] = {member.value: member for member in LayerService}
+_LAYER_GROUP_SERVICES: Dict[str, LayerGroupService] = {member.value: member for member in LayerGroupService}
+
+
+# Calls `to_dict()` on a component, used when representing collections of components as lists
+_to_dict = methodcaller("to_dict")
+
+
 class Server:
     """
     Represents an application, service or platform that provides access to layers.
@@ -94,6 +110,8 @@ class Server:
     Servers MUST be globally unique.
     """
 
+    __slots__ = ("id", "label", "hostname", "type", "version")
+
     def __init__(self, server_id: str, label: str, hostname: str, server_type: str, version: str):
         """
         Server_id should be defined independently from the server they are based on (i.e. they should be assigned by
@@ -108,7 +126,7 @@ class Server:
         self.id = server_id
         self.label = label
         self.hostname = hostname
-        self.type = ServerType(server_type)
+        self.type = _SERVER_TYPES.get(server_type) or ServerType(server_type)
         self.version = version
 
     def to_dict(self) -> Dict[str, str]:
@@ -155,6 +173,8 @@ class Namespace:
     servers to avoid confusion.
     """
 
+    __slots__ = ("id", "label", "title", "namespace", "relationships")
+
     def __init__(self, namespace_id: str, label: str, title: str, namespace: str, server: Server = None):
         """
         Namespace_id should be defined independently from the namespace they are based on (i.e. they should be assigned
@@ -211,6 +231,8 @@ class Repository:
     Repositories belong to, and MUST be unique within, a single namespace.
     """
 
+    __slots__ = ("id", "label", "title", "type", "hostname", "database", "schema", "relationships")
+
     def __init__(
         self,
         repository_id: str,
@@ -259,7 +281,7 @@ class Repository:
         self.id = repository_id
         self.label = label
         self.title = title
-        self.type = RepositoryType(repository_type)
+        self.type = _REPOSITORY_TYPES.get(repository_type) or RepositoryType(repository_type)
         self.hostname = hostname
         self.database = database
         self.schema = schema
@@ -304,6 +326,8 @@ class Style:
     Styles belong to a single namespace and can be general, applying to multiple layers, or specific to a single layer.
     """
 
+    __slots__ = ("id", "label", "title", "type", "relationships")
+
     def __init__(self, style_id: str, label: str, title: str, style_type: str, namespace: Namespace = None):
         """
         Style_id should be defined independently from the style they are based on (i.e. they should be assigned by this
@@ -318,7 +342,7 @@ class Style:
         self.id = style_id
         self.label = label
         self.title = title
-        self.type = StyleType(style_type)
+        self.type = _STYLE_TYPES.get(style_type) or StyleType(style_type)
         self.relationships: Dict[str, Optional[Namespace]] = {}
 
         if namespace is not None:
@@ -330,18 +354,15 @@ class Style:
 
         :return: a Repository represented as a dictionary
         """
-        _style = {
+        namespace = self.relationships.get("namespaces")
+
+        return {
             "id": self.id,
             "label": self.label,
             "title": self.title,
             "type": self.type.value,
-            "relationships": {"namespaces": None},
+            "relationships": {"namespaces": namespace.id if namespace is not None else None},
         }
-        if "namespaces" in self.relationships and self.relationships["namespaces"] is not None:
-            # noinspection PyTypeChecker
-            _style["relationships"]["namespaces"] = self.relationships["namespaces"].id
-
-        return _style
 
     def __repr__(self) -> str:
         """
@@ -368,6 +389,17 @@ class Layer:
     represented by one or more styles.
     """
 
+    __slots__ = (
+        "id",
+        "label",
+        "title",
+        "type",
+        "geometry_type",
+        "services",
+        "table_view",
+        "relationships",
+    )
+
     def __init__(
         self,
         layer_id: str,
@@ -422,13 +454,13 @@ class Layer:
         self.id = layer_id
         self.label = label
         self.title = title
-        self.type = LayerType(layer_type)
-        self.services = []
+        self.type = _LAYER_TYPES.get(layer_type) or LayerType(layer_type)
+        self.services: List[LayerService] = []
         self.relationships: Dict[str, Any] = {}
 
         self.geometry_type = None
         if geometry_type is not None:
-            self.geometry_type = LayerGeometry(geometry_type)
+            self.geometry_type = _LAYER_GEOMETRIES.get(geometry_type) or LayerGeometry(geometry_type)
 
         self.table_view = None
         if table_view is not None:
@@ -436,7 +468,7 @@ class Layer:
 
         if services is not None and isinstance(services, list):
             for service in services:
-                self.services.append(LayerService(service))
+                self.services.append(_LAYER_SERVICES.get(service) or LayerService(service))
 
         if namespace is not None:
             self.relationships["namespaces"] = namespace
@@ -451,29 +483,20 @@ class Layer:
 
         :return: a Layer represented as a dictionary
         """
-        _layer = {
+        return {
             "id": self.id,
             "label": self.label,
             "title": self.title,
             "type": self.type.value,
-            "geometry": None,
-            "services": [],
+            "geometry": self.geometry_type.value if self.geometry_type is not None else None,
+            "services": [service.value for service in self.services],
             "table_view": self.table_view,
             "relationships": {
                 "namespaces": self.relationships["namespaces"].id,
                 "repositories": self.relationships["repositories"].id,
-                "styles": [],
+                "styles": [style.id for style in self.relationships.get("styles", [])],
             },
         }
-        if self.geometry_type is not None:
-            _layer["geometry"] = self.geometry_type.value
-        for service in self.services:
-            _layer["services"].append(service.value)
-        if "styles" in self.relationships:
-            for style in self.relationships["styles"]:
-                _layer["relationships"]["styles"].append(style.id)
-
-        return _layer
 
     def __repr__(self) -> str:
         """
@@ -497,6 +520,8 @@ class LayerGroup:
     Layer groups belong to a single namespace, represented by one or more styles.
     """
 
+    __slots__ = ("id", "label", "title", "geometry_type", "services", "relationships")
+
     def __init__(
         self,
         layer_group_id: str,
@@ -527,16 +552,16 @@ class LayerGroup:
         self.id = layer_group_id
         self.label = label
         self.title = title
-        self.services = []
+        self.services: List[LayerGroupService] = []
         self.relationships: Dict[str, Any] = {}
 
         self.geometry_type = None
         if geometry_type is not None:
-            self.geometry_type = LayerGeometry(geometry_type)
+            self.geometry_type = _LAYER_GEOMETRIES.get(geometry_type) or LayerGeometry(geometry_type)
 
         if services is not None and isinstance(services, list):
             for service in services:
-                self.services.append(LayerGroupService(service))
+                self.services.append(_LAYER_GROUP_SERVICES.get(service) or LayerGroupService(service))
 
         if namespace is not None:
             self.relationships["namespaces"] = namespace
@@ -551,32 +576,21 @@ class LayerGroup:
 
         :return: a LayerGroup represented as a dictionary
         """
-        _layer_group: Dict[str, Any] = {
+        namespace = self.relationships.get("namespaces")
+
+        return {
             "id": self.id,
             "label": self.label,
             "title": self.title,
-            "geometry": None,
-            "services": [],
-            "relationships": {"namespaces": None, "layers": [], "styles": []},
+            "geometry": str(self.geometry_type.value) if self.geometry_type is not None else None,
+            "services": [service.value for service in self.services],
+            "relationships": {
+                "namespaces": namespace.id if namespace is not None else None,
+                "layers": [layer.id for layer in self.relationships.get("layers", [])],
+                "styles": [style.id for style in self.relationships.get("styles", [])],
+            },
         }
 
-        if self.geometry_type is not None:
-            _layer_group["geometry"] = str(self.geometry_type.value)
-        for service in self.services:
-            _layer_group["services"].append(service.value)
-
-        if "namespaces" in self.relationships and self.relationships["namespaces"] is not None:
-            # noinspection PyTypeChecker
-            _layer_group["relationships"]["namespaces"] = self.relationships["namespaces"].id
-        if "layers" in self.relationships:
-            for layer in self.relationships["layers"]:
-                _layer_group["relationships"]["layers"].append(layer.id)
-        if "styles" in self.relationships:
-            for style in self.relationships["styles"]:
-                _layer_group["relationships"]["styles"].append(style.id)
-
-        return _layer_group
-
     def __repr__(self) -> str:
         """
         :return: String representation of a LayerGroup
@@ -589,6 +603,8 @@ class Servers(dict):
     Represents a collection of Servers.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Servers, self).__init__(*args, **kwargs)
 
@@ -598,17 +614,180 @@ class Servers(dict):
 
         :return: a collection of Servers represented as dictionaries
         """
-        _servers = []
-        for server in self.values():
-            _servers.append(server.to_dict())
-        return _servers
+        return list(map(_to_dict, self.values()))
+
+
+class LabelIndexedComponents(dict):
+    """
+    Base class for collections of components that can be looked up by their name/label (as well as their identifier).
+
+    Labels are indexed as items are added to the collection, rather than scanning all items in each lookup. Labels are
+    indexed both on their own and combined with the label of the namespace an item belongs to (where applicable).
+
+    Where multiple items share a label, the first item in the collection is returned (i.e. the same item a scan would
+    find). The keys of items sharing each label are tracked in collection order, so that when an item is replaced or
+    removed, only the labels it was indexed under are updated.
+
+    All methods that add, replace or remove items keep these indexes up to date. Labels are read when items are added,
+    so items (and their namespaces) must not be relabelled once added to a collection, otherwise lookups will be stale.
+    """
+
+    __slots__ = (
+        "_by_label",
+        "_by_namespace_label",
+        "_label_keys",
+        "_namespace_label_keys",
+        "_item_labels",
+        "_positions",
+        "_next_position",
+    )
+
+    def __init__(self, *args, **kwargs):
+        super(LabelIndexedComponents, self).__init__()
+        self._by_label: Dict[str, Any] = {}
+        self._by_namespace_label: Dict[Tuple[str, Optional[str]], Any] = {}
+        self._label_keys: Dict[str, Dict[str, None]] = {}
+        self._namespace_label_keys: Dict[Tuple[str, Optional[str]], Dict[str, None]] = {}
+        self._item_labels: Dict[str, Tuple[str, Tuple[str, Optional[str]]]] = {}
+        self._positions: Dict[str, int] = {}
+        self._next_position: int = 0
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key: str, item: Any) -> None:
+        if key not in self:
+            self._positions[key] = self._next_position
+            self._next_position += 1
+        elif self._item_labels[key] != self._get_item_labels(item=item):
+            self._unindex(key=key)
+        super(LabelIndexedComponents, self).__setitem__(key, item)
+        self._index(key=key, item=item)
+
+    def __delitem__(self, key: str) -> None:
+        super(LabelIndexedComponents, self).__delitem__(key)
+        self._unindex(key=key)
+        del self._positions[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, item in dict(*args, **kwargs).items():
+            self[key] = item
+
+    def __ior__(self, other: Any) -> "LabelIndexedComponents":
+        self.update(other)
+        return self
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self:
+            return super(LabelIndexedComponents, self).pop(key, *default)
+        item = self[key]
+        del self[key]
+        return item
+
+    def popitem(self) -> Tuple[str, Any]:
+        if len(self) == 0:
+            return super(LabelIndexedComponents, self).popitem()
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def clear(self) -> None:
+        super(LabelIndexedComponents, self).clear()
+        self._by_label.clear()
+        self._by_namespace_label.clear()
+        self._label_keys.clear()
+        self._namespace_label_keys.clear()
+        self._item_labels.clear()
+        self._positions.clear()
+
+    @staticmethod
+    def _get_item_labels(item: Any) -> Tuple[str, Tuple[str, Optional[str]]]:
+        """
+        Gets the labels an item is indexed under
+
+        :param item: item to get labels for
+        :return: the item's label, and the item's label combined with the label of its namespace (if any)
+        """
+        namespace = item.relationships.get("namespaces")
+        return item.label, (item.label, namespace.label if namespace is not None else None)
+
+    def _index(self, key: str, item: Any) -> None:
+        """
+        Adds an item to the label indexes, where it is the first item in the collection with its label (and namespace)
+
+        :param key: key of the item in the collection
+        :param item: item to index
+        """
+        label, namespace_label = self._get_item_labels(item=item)
+        self._item_labels[key] = (label, namespace_label)
+
+        self._index_key(index=self._by_label, keys=self._label_keys, index_key=label, key=key)
+        self._index_key(
+            index=self._by_namespace_label, keys=self._namespace_label_keys, index_key=namespace_label, key=key
+        )
+
+    def _index_key(self, index: Dict[Any, Any], keys: Dict[Any, Dict[str, None]], index_key: Any, key: str) -> None:
+        """
+        Adds an item to a label index
+
+        Keys sharing a label are kept in collection order, so the first item for a label is always the first key. New
+        items are added to the end of the collection, so keys only need sorting where a replaced item changes label.
+
+        :param index: label index to update
+        :param keys: keys of the items sharing each label in the index
+        :param index_key: label (or label and namespace label) to index the item under
+        :param key: key of the item in the collection
+        """
+        label_keys = keys.setdefault(index_key, {})
+        if key not in label_keys:
+            if len(label_keys) > 0 and self._positions[key] < self._positions[next(reversed(label_keys))]:
+                label_keys = keys[index_key] = dict.fromkeys(
+                    sorted([*label_keys, key], key=self._positions.__getitem__)
+                )
+            else:
+                label_keys[key] = None
+        index[index_key] = super(LabelIndexedComponents, self).__getitem__(next(iter(label_keys)))
+
+    def _unindex(self, key: str) -> None:
+        """
+        Removes an item from the label indexes, where another item with the same label (and namespace) may replace it
+
+        :param key: key of the item in the collection
+        """
+        label, namespace_label = self._item_labels.pop(key)
+
+        self._unindex_key(index=self._by_label, keys=self._label_keys, index_key=label, key=key)
+        self._unindex_key(
+            index=self._by_namespace_label, keys=self._namespace_label_keys, index_key=namespace_label, key=key
+        )
+
+    def _unindex_key(self, index: Dict[Any, Any], keys: Dict[Any, Dict[str, None]], index_key: Any, key: str) -> None:
+        """
+        Removes an item from a label index, indexing the next item with the same label instead (if any)
+
+        :param index: label index to update
+        :param keys: keys of the items sharing each label in the index
+        :param index_key: label (or label and namespace label) the item is indexed under
+        :param key: key of the item in the collection
+        """
+        label_keys = keys[index_key]
+        del label_keys[key]
+        if len(label_keys) == 0:
+            del keys[index_key]
+            del index[index_key]
+            return
+        index[index_key] = super(LabelIndexedComponents, self).__getitem__(next(iter(label_keys)))
 
 
-class Namespaces(dict):
+class Namespaces(LabelIndexedComponents):
     """
     Represents a collection of Namespaces.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Namespaces, self).__init__(*args, **kwargs)
 
@@ -622,10 +801,7 @@ class Namespaces(dict):
 
         :return: Matching namespace or None if no matching namespace found
         """
-        for item in self.values():
-            if item.label == label:
-                return item
-        return None
+        return self._by_label.get(label)
 
     def to_list(self) -> List[Dict]:
         """
@@ -633,17 +809,16 @@ class Namespaces(dict):
 
         :return: a collection of Namespaces represented as dictionaries
         """
-        _namespaces = []
-        for namespace in self.values():
-            _namespaces.append(namespace.to_dict())
-        return _namespaces
+        return list(map(_to_dict, self.values()))
 
 
-class Repositories(dict):
+class Repositories(LabelIndexedComponents):
     """
     Represents a collection of Repositories.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Repositories, self).__init__(*args, **kwargs)
 
@@ -657,10 +832,7 @@ class Repositories(dict):
 
         :return: Matching style or None if no matching repositories found
         """
-        for item in self.values():
-            if item.label == label:
-                return item
-        return None
+        return self._by_label.get(label)
 
     def to_list(self) -> List[Dict]:
         """
@@ -668,17 +840,16 @@ class Repositories(dict):
 
         :return: a collection of Repositories represented as dictionaries
         """
-        _repositories = []
-        for repository in self.values():
-            _repositories.append(repository.to_dict())
-        return _repositories
+        return list(map(_to_dict, self.values()))
 
 
-class Styles(dict):
+class Styles(LabelIndexedComponents):
     """
     Represents a collection of Styles.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Styles, self).__init__(*args, **kwargs)
 
@@ -694,14 +865,9 @@ class Styles(dict):
 
         :return: Matching style or None if no matching style found
         """
-        for item in self.values():
-            if item.label == label:
-                if namespace_label is None:
-                    return item
-                else:
-                    if item.relationships["namespaces"].label == namespace_label:
-                        return item
-        return None
+        if namespace_label is None:
+            return self._by_label.get(label)
+        return self._by_namespace_label.get((label, namespace_label))
 
     def to_list(self) -> List[Dict]:
         """
@@ -709,17 +875,16 @@ class Styles(dict):
 
         :return: a collection of Styles represented as dictionaries
         """
-        _styles = []
-        for style in self.values():
-            _styles.append(style.to_dict())
-        return _styles
+        return list(map(_to_dict, self.values()))
 
 
-class Layers(dict):
+class Layers(LabelIndexedComponents):
     """
     Represents a collection of Layers.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Layers, self).__init__(*args, **kwargs)
 
@@ -735,14 +900,9 @@ class Layers(dict):
 
         :return: Matching layer or None if no matching layer found
         """
-        for item in self.values():
-            if item.label == label:
-                if namespace_label is None:
-                    return item
-                else:
-                    if item.relationships["namespaces"].label == namespace_label:
-                        return item
-        return None
+        if namespace_label is None:
+            return self._by_label.get(label)
+        return self._by_namespace_label.get((label, namespace_label))
 
     def to_list(self) -> List[Dict]:
         """
@@ -750,10 +910,7 @@ class Layers(dict):
 
         :return: a collection of Layers represented as dictionaries
         """
-        _layers = []
-        for layer in self.values():
-            _layers.append(layer.to_dict())
-        return _layers
+        return list(map(_to_dict, self.values()))
 
 
 class LayerGroups(dict):
@@ -761,5 +918,7 @@ class LayerGroups(dict):
     Represents a collection of LayerGroups.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(LayerGroups, self).__init__(*args, **kwargs)
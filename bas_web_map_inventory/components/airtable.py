@@ -1,10 +1,14 @@
 from enum import Enum
-from typing import Dict, List, Union, Any, Optional
-
-# noinspection PyPackageRequirements
-from airtable import Airtable as _Airtable
+from typing import Dict, List, Tuple, Union, Any, Optional, TYPE_CHECKING
 
 from bas_web_map_inventory.components import (
+    ServerType,
+    RepositoryType,
+    StyleType,
+    LayerType,
+    LayerGeometry,
+    LayerService,
+    LayerGroupService,
     Server,
     Namespace,
     Repository,
@@ -19,6 +23,11 @@ from bas_web_map_inventory.components import (
     LayerGroups,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    # The Airtable client is only needed for type hints here, it's imported where needed to avoid its import cost
+    # noinspection PyPackageRequirements
+    from airtable import Airtable as _Airtable
+
 
 class Airtable:
     """
@@ -43,7 +52,7 @@ class Airtable:
     ItemClass: Any = None
     ItemClassAirtable: Any = None
 
-    def __init__(self, airtable: _Airtable, items, **kwargs):
+    def __init__(self, airtable: "_Airtable", items, **kwargs):
         """
         :param airtable: upstream Airtable SDK class instance
         :param items: collection of items (layers, repositories, etc.)
@@ -62,8 +71,8 @@ class Airtable:
         self.orphaned: List[str] = []
 
         if items is not None:
-            for item in items.values():
-                self.items_local[item.id] = self.ItemClassAirtable(item=item, **self.kwargs)
+            item_class_airtable = self.ItemClassAirtable
+            self.items_local = {item.id: item_class_airtable(item=item, **kwargs) for item in items.values()}
 
         self.stat()
 
@@ -86,30 +95,42 @@ class Airtable:
         self.outdated = []
         self.orphaned = []
 
+        # Attributes used for each item are bound locally, as tables may contain many items
+        item_class_airtable = self.ItemClassAirtable
+        kwargs = self.kwargs
+        items_local = self.items_local
+        items_airtable = self.items_airtable
+        airtable_ids_to_ids = self.airtable_ids_to_ids
+
         for airtable_item in self.airtable.get_all():
             item_id = airtable_item["fields"]["ID"]
             try:
-                item = self.ItemClassAirtable(item=airtable_item, **self.kwargs)
-                self.items_airtable[item.id] = item
-
-                # try to add Airtable ID to corresponding local item, if missing assume item is orphaned
-                self.items_local[item.id].airtable_id = item.airtable_id
-                self.airtable_ids_to_ids[item.airtable_id] = item.id
+                item = item_class_airtable(item=airtable_item, **kwargs)
             except KeyError:
                 self.orphaned.append(item_id)
                 continue
+            items_airtable[item.id] = item
 
-        for item in self.items_local.values():
-            try:
-                if item != self.items_airtable[item.id]:
-                    self.outdated.append(item.id)
-                    continue
+            # try to add Airtable ID to corresponding local item, if missing assume item is orphaned
+            local_item = items_local.get(item.id)
+            if local_item is None:
+                self.orphaned.append(item_id)
+                continue
+            local_item.airtable_id = item.airtable_id
+            airtable_ids_to_ids[item.airtable_id] = item.id
 
-                self.current.append(item.id)
-            except KeyError:
+        for item in items_local.values():
+            airtable_item = items_airtable.get(item.id)
+            if airtable_item is None:
                 self.missing.append(item.id)
                 continue
 
+            if item != airtable_item:
+                self.outdated.append(item.id)
+                continue
+
+            self.current.append(item.id)
+
     def get_by_id(self, item_id: str):
         """
         Gets a local item by its identifier
@@ -136,9 +157,8 @@ class Airtable:
 
         The Airtable SDK's batch insert method is used to automatically comply with Airtable's rate limiting.
         """
-        _items = []
-        for missing_id in self.missing:
-            _items.append(self.items_local[missing_id].airtable_fields())
+        items_local = self.items_local
+        _items = [items_local[missing_id].airtable_fields() for missing_id in self.missing]
         self.airtable.batch_insert(records=_items)
 
     def sync(self) -> None:
@@ -151,13 +171,14 @@ class Airtable:
         """
         self.load()
 
+        items_local = self.items_local
+        airtable_update = self.airtable.update
         for outdated_id in self.outdated:
-            item = self.items_local[outdated_id]
-            self.airtable.update(record_id=item.airtable_id, fields=item.airtable_fields())
+            item = items_local[outdated_id]
+            airtable_update(record_id=item.airtable_id, fields=item.airtable_fields())
 
-        _ids = []
-        for orphaned_id in self.orphaned:
-            _ids.append(self.items_airtable[orphaned_id].airtable_id)
+        items_airtable = self.items_airtable
+        _ids = [items_airtable[orphaned_id].airtable_id for orphaned_id in self.orphaned]
         self.airtable.batch_delete(record_ids=_ids)
 
     def reset(self) -> None:
@@ -169,20 +190,23 @@ class Airtable:
         The Airtable SDK's batch delete method is used for orphaned items to automatically comply with Airtable's rate
         limiting.
         """
-        _ids = []
-        for item in self.items_airtable.values():
-            _ids.append(item.airtable_id)
+        _ids = [item.airtable_id for item in self.items_airtable.values()]
         self.airtable.batch_delete(record_ids=_ids)
 
-    def status(self) -> Dict[str, List[str]]:
+    def status(self, refresh: bool = True) -> Dict[str, List[str]]:
         """
         Outputs the state of a set of local items compared to items stored in an Airtable table
 
         Item identifiers are organised by state (see the stat() method for possible states).
 
+        The state of items is calculated when this class is created. Where nothing has changed since, recalculating
+        this state (which requires requesting all items from Airtable again) can be skipped.
+
+        :param refresh: whether to recalculate the state of items before outputting it
         :return: identifiers of items organised by state
         """
-        self.stat()
+        if refresh:
+            self.stat()
 
         return {"current": self.current, "outdated": self.outdated, "missing": self.missing, "orphaned": self.orphaned}
 
@@ -269,6 +293,65 @@ class LayerGroupServiceAirtable(Enum):
     WFS = "WFS"
 
 
+# Lookup tables for enumeration members by value, used when loading items from Airtable in bulk as these are
+# considerably quicker than calling the enumeration (e.g. `LayerServiceAirtable("WMS")`) for each value.
+_SERVER_TYPES_AIRTABLE: Dict[str, ServerTypeAirtable] = {member.value: member for member in ServerTypeAirtable}
+_REPOSITORY_TYPES_AIRTABLE: Dict[str, RepositoryTypeAirtable] = {
+    member.value: member for member in RepositoryTypeAirtable
+}
+_STYLE_TYPES_AIRTABLE: Dict[str, StyleTypeAirtable] = {member.value: member for member in StyleTypeAirtable}
+_LAYER_TYPES_AIRTABLE: Dict[str, LayerTypeAirtable] = {member.value: member for member in LayerTypeAirtable}
+_LAYER_GEOMETRIES_AIRTABLE: Dict[str, LayerGeometryAirtable] = {
+    member.value: member for member in LayerGeometryAirtable
+}
+_LAYER_SERVICES_AIRTABLE: Dict[str, LayerServiceAirtable] = {member.value: member for member in LayerServiceAirtable}
+_LAYER_GROUP_SERVICES_AIRTABLE: Dict[str, LayerGroupServiceAirtable] = {
+    member.value: member for member in LayerGroupServiceAirtable
+}
+
+# Lookup tables from generic enumeration members to their Airtable equivalents (matched by name), used when wrapping
+# local items in bulk instead of looking up each member by name (e.g. `LayerServiceAirtable[service.name]`).
+_SERVER_TYPES_TO_AIRTABLE: Dict[ServerType, ServerTypeAirtable] = {
+    member: ServerTypeAirtable[member.name] for member in ServerType
+}
+_REPOSITORY_TYPES_TO_AIRTABLE: Dict[RepositoryType, RepositoryTypeAirtable] = {
+    member: RepositoryTypeAirtable[member.name] for member in RepositoryType
+}
+_STYLE_TYPES_TO_AIRTABLE: Dict[StyleType, StyleTypeAirtable] = {
+    member: StyleTypeAirtable[member.name] for member in StyleType
+}
+_LAYER_TYPES_TO_AIRTABLE: Dict[LayerType, LayerTypeAirtable] = {
+    member: LayerTypeAirtable[member.name] for member in LayerType
+}
+_LAYER_GEOMETRIES_TO_AIRTABLE: Dict[LayerGeometry, LayerGeometryAirtable] = {
+    member: LayerGeometryAirtable[member.name] for member in LayerGeometry
+}
+_LAYER_SERVICES_TO_AIRTABLE: Dict[LayerService, LayerServiceAirtable] = {
+    member: LayerServiceAirtable[member.name] for member in LayerService
+}
+_LAYER_GROUP_SERVICES_TO_AIRTABLE: Dict[LayerGroupService, LayerGroupServiceAirtable] = {
+    member: LayerGroupServiceAirtable[member.name] for member in LayerGroupService
+}
+
+
+def _get_by_airtable_ids(items: "Airtable", item_airtable_ids: List[str], item_type: str) -> Tuple[Any, ...]:
+    """
+    Gets local items by their corresponding Airtable (i.e. foreign) identifiers, such as the styles of a layer
+
+    :param items: Airtable collection to get local items from
+    :param item_airtable_ids: Airtable native identifiers for local items
+    :param item_type: name of the type of item (e.g. 'Style'), used in error messages
+    :return: local items with corresponding Airtable native identifiers, in the same order
+    """
+    _items = []
+    for item_airtable_id in item_airtable_ids:
+        try:
+            _items.append(items.get_by_airtable_id(item_airtable_id))
+        except KeyError:
+            raise KeyError(f"{item_type} with Airtable ID [{item_airtable_id}] not found.")
+    return tuple(_items)
+
+
 class ServerAirtable:
     """
     Wrapper around the generic Server class to represent Servers in Airtable.
@@ -276,6 +359,8 @@ class ServerAirtable:
     See 'Airtable' class for general information.
     """
 
+    __slots__ = ("airtable_id", "id", "name", "hostname", "type", "version")
+
     # noinspection PyUnusedLocal
     def __init__(self, item: Union[Server, dict], **kwargs):
         """
@@ -292,15 +377,16 @@ class ServerAirtable:
             self.id = item.id
             self.name = item.label
             self.hostname = item.hostname
-            self.type = ServerTypeAirtable[item.type.name]
+            self.type = _SERVER_TYPES_TO_AIRTABLE[item.type]
             self.version = item.version
         elif isinstance(item, dict):
+            fields = item["fields"]
             self.airtable_id = item["id"]
-            self.id = item["fields"]["ID"]
-            self.name = item["fields"]["Name"]
-            self.hostname = item["fields"]["Hostname"]
-            self.type = ServerTypeAirtable(item["fields"]["Type"])
-            self.version = item["fields"]["Version"]
+            self.id = fields["ID"]
+            self.name = fields["Name"]
+            self.hostname = fields["Hostname"]
+            self.type = _SERVER_TYPES_AIRTABLE.get(fields["Type"]) or ServerTypeAirtable(fields["Type"])
+            self.version = fields["Version"]
         else:
             raise TypeError("Item must be a dict or Server object")
 
@@ -320,9 +406,9 @@ class ServerAirtable:
             "Version": self.version,
         }
 
-    def _dict(self) -> Dict[str, str]:
+    def _key(self) -> Tuple[str, str, str, ServerTypeAirtable, str]:
         """
-        Outputs an item's internal properties as a dictionary
+        Outputs an item's internal properties as a tuple
 
         Internal properties are properties that relate directly to the resource, rather than properties assigned to
         the resource by external entities (such as an Airtable ID).
@@ -331,13 +417,7 @@ class ServerAirtable:
 
         :return: a Server's internal properties
         """
-        return {
-            "id": self.id,
-            "name": self.name,
-            "hostname": self.hostname,
-            "type": self.type.value,
-            "version": self.version,
-        }
+        return (self.id, self.name, self.hostname, self.type, self.version)
 
     def __repr__(self) -> str:
         """
@@ -354,7 +434,7 @@ class ServerAirtable:
         :return: Whether an Airtable Server is effectively equal to another
         """
         # noinspection PyProtectedMember
-        return self._dict() == other._dict()
+        return self._key() == other._key()
 
 
 class NamespaceAirtable:
@@ -364,6 +444,8 @@ class NamespaceAirtable:
     See 'Airtable' class for general information.
     """
 
+    __slots__ = ("airtable_id", "id", "name", "title", "server")
+
     def __init__(self, item: Union[Namespace, dict], **kwargs):
         """
         :param item: a (local) Namespace object or a (remote) Airtable representation of a Namespace object
@@ -383,16 +465,18 @@ class NamespaceAirtable:
             self.title = item.title
             self.server = kwargs["servers_airtable"].get_by_id(item.relationships["servers"].id)
         elif isinstance(item, dict):
+            fields = item["fields"]
             self.airtable_id = item["id"]
-            self.id = item["fields"]["ID"]
-            self.name = item["fields"]["Name"]
-            self.title = item["fields"]["Title"]
+            self.id = fields["ID"]
+            self.name = fields["Name"]
+            self.title = fields["Title"]
 
-            if "Server" in item["fields"]:
+            server_ids = fields.get("Server")
+            if server_ids is not None:
                 try:
-                    self.server = kwargs["servers_airtable"].get_by_airtable_id(item["fields"]["Server"][0])
+                    self.server = kwargs["servers_airtable"].get_by_airtable_id(server_ids[0])
                 except KeyError:
-                    raise KeyError(f"Server with Airtable ID [{item['fields']['Server'][0]}] not found.")
+                    raise KeyError(f"Server with Airtable ID [{server_ids[0]}] not found.")
         else:
             raise TypeError("Item must be a dict or Namespace object")
 
@@ -407,9 +491,9 @@ class NamespaceAirtable:
         """
         return {"ID": self.id, "Name": self.name, "Title": self.title, "Server": [self.server.airtable_id]}
 
-    def _dict(self) -> Dict[str, str]:
+    def _key(self) -> Tuple[str, str, str, str]:
         """
-        Outputs an item's internal properties as a dictionary
+        Outputs an item's internal properties as a tuple
 
         Internal properties are properties that relate directly to the resource, rather than properties assigned to
         the resource by external entities (such as an Airtable ID).
@@ -418,7 +502,7 @@ class NamespaceAirtable:
 
         :return: a Namespace's internal properties
         """
-        return {"id": self.id, "name": self.name, "title": self.title, "server": self.server.id}
+        return (self.id, self.name, self.title, self.server.id)
 
     def __repr__(self) -> str:
         """
@@ -435,7 +519,7 @@ class NamespaceAirtable:
         :return: Whether an Airtable Namespace is effectively equal to another
         """
         # noinspection PyProtectedMember
-        return self._dict() == other._dict()
+        return self._key() == other._key()
 
 
 class RepositoryAirtable:
@@ -445,6 +529,8 @@ class RepositoryAirtable:
     See 'Airtable' class for general information.
     """
 
+    __slots__ = ("airtable_id", "id", "name", "title", "type", "host", "database", "schema", "workspace")
+
     def __init__(self, item: Union[Repository, dict], **kwargs):
         """
         :param item: a (local) Repository object or a (remote) Airtable representation of a Repository object
@@ -466,33 +552,29 @@ class RepositoryAirtable:
             self.id = item.id
             self.name = item.label
             self.title = item.title
-            self.type = RepositoryTypeAirtable[item.type.name]
+            self.type = _REPOSITORY_TYPES_TO_AIRTABLE[item.type]
             self.host = item.hostname
             self.database = item.database
             self.schema = item.schema
             self.workspace = kwargs["namespaces_airtable"].get_by_id(item.relationships["namespaces"].id)
         elif isinstance(item, dict):
+            fields = item["fields"]
             self.airtable_id = item["id"]
-            self.id = item["fields"]["ID"]
-            self.name = item["fields"]["Name"]
-            self.title = item["fields"]["Title"]
-            self.type = RepositoryTypeAirtable(item["fields"]["Type"])
-
-            self.host = None
-            if "Host" in item["fields"]:
-                self.host = item["fields"]["Host"]
-            self.database = None
-            if "Database" in item["fields"]:
-                self.database = item["fields"]["Database"]
-            self.schema = None
-            if "Schema" in item["fields"]:
-                self.schema = item["fields"]["Schema"]
-
-            if "Workspace" in item["fields"]:
+            self.id = fields["ID"]
+            self.name = fields["Name"]
+            self.title = fields["Title"]
+            self.type = _REPOSITORY_TYPES_AIRTABLE.get(fields["Type"]) or RepositoryTypeAirtable(fields["Type"])
+
+            self.host = fields.get("Host")
+            self.database = fields.get("Database")
+            self.schema = fields.get("Schema")
+
+            workspace_ids = fields.get("Workspace")
+            if workspace_ids is not None:
                 try:
-                    self.workspace = kwargs["namespaces_airtable"].get_by_airtable_id(item["fields"]["Workspace"][0])
+                    self.workspace = kwargs["namespaces_airtable"].get_by_airtable_id(workspace_ids[0])
                 except KeyError:
-                    raise KeyError(f"Namespace with Airtable ID [{item['fields']['Workspace'][0]}] not found.")
+                    raise KeyError(f"Namespace with Airtable ID [{workspace_ids[0]}] not found.")
         else:
             raise TypeError("Item must be a dict or Repository object")
 
@@ -516,9 +598,9 @@ class RepositoryAirtable:
             "Workspace": [self.workspace.airtable_id],
         }
 
-    def _dict(self) -> Dict[str, Union[Optional[str], List[Optional[str]]]]:
+    def _key(self) -> Tuple[Any, ...]:
         """
-        Outputs an item's internal properties as a dictionary
+        Outputs an item's internal properties as a tuple
 
         Internal properties are properties that relate directly to the resource, rather than properties assigned to
         the resource by external entities (such as an Airtable ID).
@@ -527,16 +609,16 @@ class RepositoryAirtable:
 
         :return: a Repositories internal properties
         """
-        return {
-            "id": self.id,
-            "name": self.name,
-            "title": self.title,
-            "type": self.type.value,
-            "host": self.host,
-            "database": self.database,
-            "schema": self.schema,
-            "workspace": [self.workspace.airtable_id],
-        }
+        return (
+            self.id,
+            self.name,
+            self.title,
+            self.type,
+            self.host,
+            self.database,
+            self.schema,
+            self.workspace.airtable_id,
+        )
 
     def __repr__(self) -> str:
         """
@@ -553,7 +635,7 @@ class RepositoryAirtable:
         :return: Whether an Airtable Repository is effectively equal to another
         """
         # noinspection PyProtectedMember
-        return self._dict() == other._dict()
+        return self._key() == other._key()
 
 
 class StyleAirtable:
@@ -563,6 +645,8 @@ class StyleAirtable:
     See 'Airtable' class for general information.
     """
 
+    __slots__ = ("airtable_id", "id", "name", "title", "type", "workspace")
+
     def __init__(self, item: Union[Style, dict], **kwargs):
         """
         :param item: a (local) Style object or a (remote) Airtable representation of a Style object
@@ -581,24 +665,27 @@ class StyleAirtable:
             self.id = item.id
             self.name = item.label
             self.title = item.title
-            self.type = StyleTypeAirtable[item.type.name]
+            self.type = _STYLE_TYPES_TO_AIRTABLE[item.type]
 
             self.workspace = None
-            if "namespaces" in item.relationships and item.relationships["namespaces"] is not None:
-                self.workspace = kwargs["namespaces_airtable"].get_by_id(item.relationships["namespaces"].id)
+            namespace = item.relationships.get("namespaces")
+            if namespace is not None:
+                self.workspace = kwargs["namespaces_airtable"].get_by_id(namespace.id)
         elif isinstance(item, dict):
+            fields = item["fields"]
             self.airtable_id = item["id"]
-            self.id = item["fields"]["ID"]
-            self.name = item["fields"]["Name"]
-            self.title = item["fields"]["Title"]
-            self.type = StyleTypeAirtable(item["fields"]["Type"])
+            self.id = fields["ID"]
+            self.name = fields["Name"]
+            self.title = fields["Title"]
+            self.type = _STYLE_TYPES_AIRTABLE.get(fields["Type"]) or StyleTypeAirtable(fields["Type"])
 
             self.workspace = None
-            if "Workspace" in item["fields"]:
+            workspace_ids = fields.get("Workspace")
+            if workspace_ids is not None:
                 try:
-                    self.workspace = kwargs["namespaces_airtable"].get_by_airtable_id(item["fields"]["Workspace"][0])
+                    self.workspace = kwargs["namespaces_airtable"].get_by_airtable_id(workspace_ids[0])
                 except KeyError:
-                    raise KeyError(f"Namespace with Airtable ID [{item['fields']['Workspace'][0]}] not found.")
+                    raise KeyError(f"Namespace with Airtable ID [{workspace_ids[0]}] not found.")
         else:
             raise TypeError("Item must be a dict or Style object")
 
@@ -622,9 +709,9 @@ class StyleAirtable:
 
         return _fields
 
-    def _dict(self) -> Dict[str, Union[str, List[str]]]:
+    def _key(self) -> Tuple[Any, ...]:
         """
-        Outputs an item's internal properties as a dictionary
+        Outputs an item's internal properties as a tuple
 
         Internal properties are properties that relate directly to the resource, rather than properties assigned to
         the resource by external entities (such as an Airtable ID).
@@ -633,16 +720,13 @@ class StyleAirtable:
 
         :return: a Style's internal properties
         """
-        _dict = {
-            "id": self.id,
-            "name": self.name,
-            "title": self.title,
-            "type": self.type.value,
-        }
-        if self.workspace is not None:
-            _dict["namespace"] = [self.workspace.airtable_id]
-
-        return _dict
+        return (
+            self.id,
+            self.name,
+            self.title,
+            self.type,
+            (self.workspace.airtable_id,) if self.workspace is not None else None,
+        )
 
     def __repr__(self) -> str:
         """
@@ -659,7 +743,7 @@ class StyleAirtable:
         :return: Whether an Airtable Style is effectively equal to another
         """
         # noinspection PyProtectedMember
-        return self._dict() == other._dict()
+        return self._key() == other._key()
 
 
 class LayerAirtable:
@@ -669,6 +753,20 @@ class LayerAirtable:
     See 'Airtable' class for general information.
     """
 
+    __slots__ = (
+        "airtable_id",
+        "id",
+        "name",
+        "title",
+        "type",
+        "geometry",
+        "services",
+        "table_view",
+        "workspace",
+        "store",
+        "styles",
+    )
+
     def __init__(self, item: Union[Layer, dict], **kwargs):
         """
         :param item: a (local) Layer object or a (remote) Airtable representation of a Layer object
@@ -679,11 +777,11 @@ class LayerAirtable:
         self.title: str
         self.type: LayerTypeAirtable
         self.geometry: LayerGeometryAirtable
-        self.services: List[LayerServiceAirtable] = []
+        self.services: Tuple[LayerServiceAirtable, ...] = ()
         self.table_view: str
         self.workspace: NamespaceAirtable
         self.store: RepositoryAirtable
-        self.styles: List[StyleAirtable] = []
+        self.styles: Tuple[StyleAirtable, ...] = ()
 
         if "namespaces_airtable" not in kwargs:
             raise RuntimeError("NamespacesAirtable collection not included as keyword argument.")
@@ -696,56 +794,55 @@ class LayerAirtable:
             self.id = item.id
             self.name = item.label
             self.title = item.title
-            self.type = LayerTypeAirtable[item.type.name]
+            self.type = _LAYER_TYPES_TO_AIRTABLE[item.type]
 
             self.geometry = None
             if item.geometry_type is not None:
-                self.geometry = LayerGeometryAirtable[item.geometry_type.name]
-            self.services = []
-            for service in item.services:
-                self.services.append(LayerServiceAirtable[service.name])
+                self.geometry = _LAYER_GEOMETRIES_TO_AIRTABLE[item.geometry_type]
+            self.services = tuple([_LAYER_SERVICES_TO_AIRTABLE[service] for service in item.services])
             self.table_view = None
             if item.table_view is not None:
                 self.table_view = item.table_view
 
             self.workspace = kwargs["namespaces_airtable"].get_by_id(item.relationships["namespaces"].id)
             self.store = kwargs["repositories_airtable"].get_by_id(item.relationships["repositories"].id)
-            for style_id in item.relationships["styles"]:
-                self.styles.append(kwargs["styles_airtable"].get_by_id(style_id.id))
+            get_style = kwargs["styles_airtable"].get_by_id
+            self.styles = tuple([get_style(style.id) for style in item.relationships["styles"]])
         elif isinstance(item, dict):
+            fields = item["fields"]
             self.airtable_id = item["id"]
-            self.id = item["fields"]["ID"]
-            self.name = item["fields"]["Name"]
-            self.title = item["fields"]["Title"]
-            self.type = LayerTypeAirtable(item["fields"]["Type"])
+            self.id = fields["ID"]
+            self.name = fields["Name"]
+            self.title = fields["Title"]
+            self.type = _LAYER_TYPES_AIRTABLE.get(fields["Type"]) or LayerTypeAirtable(fields["Type"])
 
             self.geometry = None
-            if "Geometry" in item["fields"]:
-                self.geometry = LayerGeometryAirtable(item["fields"]["Geometry"])
-            self.services = []
-            if "Services" in item["fields"]:
-                for service in item["fields"]["Services"]:
-                    self.services.append(LayerServiceAirtable(service))
-            self.table_view = None
-            if "Table/View" in item["fields"]:
-                self.table_view = item["fields"]["Table/View"]
-
-            if "Workspace" in item["fields"]:
+            geometry = fields.get("Geometry")
+            if geometry is not None:
+                self.geometry = _LAYER_GEOMETRIES_AIRTABLE.get(geometry) or LayerGeometryAirtable(geometry)
+            self.services = tuple(
+                [
+                    _LAYER_SERVICES_AIRTABLE.get(service) or LayerServiceAirtable(service)
+                    for service in fields.get("Services", [])
+                ]
+            )
+            self.table_view = fields.get("Table/View")
+
+            workspace_ids = fields.get("Workspace")
+            if workspace_ids is not None:
                 try:
-                    self.workspace = kwargs["namespaces_airtable"].get_by_airtable_id(item["fields"]["Workspace"][0])
+                    self.workspace = kwargs["namespaces_airtable"].get_by_airtable_id(workspace_ids[0])
                 except KeyError:
-                    raise KeyError(f"Namespace with Airtable ID [{item['fields']['Workspace'][0]}] not found.")
-            if "Store" in item["fields"]:
+                    raise KeyError(f"Namespace with Airtable ID [{workspace_ids[0]}] not found.")
+            store_ids = fields.get("Store")
+            if store_ids is not None:
                 try:
-                    self.store = kwargs["repositories_airtable"].get_by_airtable_id(item["fields"]["Store"][0])
+                    self.store = kwargs["repositories_airtable"].get_by_airtable_id(store_ids[0])
                 except KeyError:
-                    raise KeyError(f"Repository with Airtable ID [{item['fields']['Store'][0]}] not found.")
-            if "Styles" in item["fields"]:
-                for style_id in item["fields"]["Styles"]:
-                    try:
-                        self.styles.append(kwargs["styles_airtable"].get_by_airtable_id(style_id))
-                    except KeyError:
-                        raise KeyError(f"Style with Airtable ID [{style_id}] not found.")
+                    raise KeyError(f"Repository with Airtable ID [{store_ids[0]}] not found.")
+            self.styles = _get_by_airtable_ids(
+                items=kwargs["styles_airtable"], item_airtable_ids=fields.get("Styles", []), item_type="Style"
+            )
         else:
             raise TypeError("Item must be a dict or Layer object")
 
@@ -758,32 +855,22 @@ class LayerAirtable:
 
         :return: a Layer as Airtable fields
         """
-        _services = []
-        for service in self.services:
-            _services.append(service.value)
-        _styles = []
-        for style in self.styles:
-            _styles.append(style.airtable_id)
-        _fields = {
+        return {
             "ID": self.id,
             "Name": self.name,
             "Title": self.title,
             "Type": self.type.value,
-            "Geometry": None,
-            "Services": _services,
+            "Geometry": self.geometry.value if self.geometry is not None else None,
+            "Services": [service.value for service in self.services],
             "Table/View": self.table_view,
             "Workspace": [self.workspace.airtable_id],
             "Store": [self.store.airtable_id],
-            "Styles": _styles,
+            "Styles": [style.airtable_id for style in self.styles],
         }
-        if self.geometry is not None:
-            _fields["Geometry"] = self.geometry.value
-
-        return _fields
 
-    def _dict(self) -> Dict[str, Union[str, List[str]]]:
+    def _key(self) -> Tuple[Any, ...]:
         """
-        Outputs an item's internal properties as a dictionary
+        Outputs an item's internal properties as a tuple
 
         Internal properties are properties that relate directly to the resource, rather than properties assigned to
         the resource by external entities (such as an Airtable ID).
@@ -792,28 +879,18 @@ class LayerAirtable:
 
         :return: a Layer's internal properties
         """
-        _services = []
-        for service in self.services:
-            _services.append(service.value)
-        _styles = []
-        for style in self.styles:
-            _styles.append(style.airtable_id)
-        _dict = {
-            "id": self.id,
-            "name": self.name,
-            "title": self.title,
-            "type": self.type.value,
-            "geometry": None,
-            "services": _services,
-            "table-view": self.table_view,
-            "workspace": [self.workspace.airtable_id],
-            "store": [self.store.airtable_id],
-            "styles": _styles,
-        }
-        if self.geometry is not None:
-            _dict["geometry"] = self.geometry.value
-
-        return _dict
+        return (
+            self.id,
+            self.name,
+            self.title,
+            self.type,
+            self.geometry,
+            self.services,
+            self.table_view,
+            self.workspace.airtable_id,
+            self.store.airtable_id,
+            [style.airtable_id for style in self.styles],
+        )
 
     def __repr__(self) -> str:
         """
@@ -830,7 +907,7 @@ class LayerAirtable:
         :return: Whether an Airtable Layer is effectively equal to another
         """
         # noinspection PyProtectedMember
-        return self._dict() == other._dict()
+        return self._key() == other._key()
 
 
 class LayerGroupAirtable:
@@ -840,6 +917,8 @@ class LayerGroupAirtable:
     See 'Airtable' class for general information.
     """
 
+    __slots__ = ("airtable_id", "id", "name", "title", "services", "workspace", "layers", "styles")
+
     def __init__(self, item: Union[LayerGroup, dict], **kwargs):
         """
         :param item: a (local) LayerGroup object or a (remote) Airtable representation of a LayerGroup object
@@ -848,10 +927,10 @@ class LayerGroupAirtable:
         self.id: str
         self.name: str
         self.title: str
-        self.services: List[LayerGroupServiceAirtable] = []
+        self.services: Tuple[LayerGroupServiceAirtable, ...] = ()
         self.workspace: NamespaceAirtable
-        self.layers: List[LayerAirtable] = []
-        self.styles: List[StyleAirtable] = []
+        self.layers: Tuple[LayerAirtable, ...] = ()
+        self.styles: Tuple[StyleAirtable, ...] = ()
 
         if "namespaces_airtable" not in kwargs:
             raise RuntimeError("NamespacesAirtable collection not included as keyword argument.")
@@ -864,40 +943,38 @@ class LayerGroupAirtable:
             self.id = item.id
             self.name = item.label
             self.title = item.title
-            for service in item.services:
-                self.services.append(LayerGroupServiceAirtable[service.name])
+            self.services = tuple([_LAYER_GROUP_SERVICES_TO_AIRTABLE[service] for service in item.services])
             if item.relationships["namespaces"] is not None:
                 self.workspace = kwargs["namespaces_airtable"].get_by_id(item.relationships["namespaces"].id)
-            for layer in item.relationships["layers"]:
-                self.layers.append(kwargs["layers_airtable"].get_by_id(layer.id))
-            for style in item.relationships["styles"]:
-                self.styles.append(kwargs["styles_airtable"].get_by_id(style.id))
+            get_layer = kwargs["layers_airtable"].get_by_id
+            self.layers = tuple([get_layer(layer.id) for layer in item.relationships["layers"]])
+            get_style = kwargs["styles_airtable"].get_by_id
+            self.styles = tuple([get_style(style.id) for style in item.relationships["styles"]])
         elif isinstance(item, dict):
+            fields = item["fields"]
             self.airtable_id = item["id"]
-            self.id = item["fields"]["ID"]
-            self.name = item["fields"]["Name"]
-            self.title = item["fields"]["Title"]
-
-            if "Services" in item["fields"]:
-                for service in item["fields"]["Services"]:
-                    self.services.append(LayerGroupServiceAirtable(service))
-            if "Workspace" in item["fields"]:
+            self.id = fields["ID"]
+            self.name = fields["Name"]
+            self.title = fields["Title"]
+
+            self.services = tuple(
+                [
+                    _LAYER_GROUP_SERVICES_AIRTABLE.get(service) or LayerGroupServiceAirtable(service)
+                    for service in fields.get("Services", [])
+                ]
+            )
+            workspace_ids = fields.get("Workspace")
+            if workspace_ids is not None:
                 try:
-                    self.workspace = kwargs["namespaces_airtable"].get_by_airtable_id(item["fields"]["Workspace"][0])
+                    self.workspace = kwargs["namespaces_airtable"].get_by_airtable_id(workspace_ids[0])
                 except KeyError:
-                    raise KeyError(f"Namespace with Airtable ID [{item['fields']['Workspace'][0]}] not found.")
-            if "Layers" in item["fields"]:
-                for layer in item["fields"]["Layers"]:
-                    try:
-                        self.layers.append(kwargs["layers_airtable"].get_by_airtable_id(layer))
-                    except KeyError:
-                        raise KeyError(f"Layer with Airtable ID [{layer}] not found.")
-            if "Styles" in item["fields"]:
-                for style_id in item["fields"]["Styles"]:
-                    try:
-                        self.styles.append(kwargs["styles_airtable"].get_by_airtable_id(style_id))
-                    except KeyError:
-                        raise KeyError(f"Style with Airtable ID [{style_id}] not found.")
+                    raise KeyError(f"Namespace with Airtable ID [{workspace_ids[0]}] not found.")
+            self.layers = _get_by_airtable_ids(
+                items=kwargs["layers_airtable"], item_airtable_ids=fields.get("Layers", []), item_type="Layer"
+            )
+            self.styles = _get_by_airtable_ids(
+                items=kwargs["styles_airtable"], item_airtable_ids=fields.get("Styles", []), item_type="Style"
+            )
         else:
             raise TypeError("Item must be a dict or LayerGroup object")
 
@@ -910,28 +987,19 @@ class LayerGroupAirtable:
 
         :return: a LayerGroup as Airtable fields
         """
-        _services = []
-        for service in self.services:
-            _services.append(service.value)
-        _layers = []
-        for layer in self.layers:
-            _layers.append(layer.airtable_id)
-        _styles = []
-        for style in self.styles:
-            _styles.append(style.airtable_id)
         return {
             "ID": self.id,
             "Name": self.name,
             "Title": self.title,
-            "Services": _services,
+            "Services": [service.value for service in self.services],
             "Workspace": [self.workspace.airtable_id],
-            "Layers": _layers,
-            "Styles": _styles,
+            "Layers": [layer.airtable_id for layer in self.layers],
+            "Styles": [style.airtable_id for style in self.styles],
         }
 
-    def _dict(self) -> Dict[str, Union[str, List[Optional[str]]]]:
+    def _key(self) -> Tuple[Any, ...]:
         """
-        Outputs an item's internal properties as a dictionary
+        Outputs an item's internal properties as a tuple
 
         Internal properties are properties that relate directly to the resource, rather than properties assigned to
         the resource by external entities (such as an Airtable ID).
@@ -940,24 +1008,15 @@ class LayerGroupAirtable:
 
         :return: a LayerGroup's internal properties
         """
-        _services = []
-        for service in self.services:
-            _services.append(service.value)
-        _layers = []
-        for layer in self.layers:
-            _layers.append(layer.airtable_id)
-        _styles = []
-        for style in self.styles:
-            _styles.append(style.airtable_id)
-        return {
-            "id": self.id,
-            "name": self.name,
-            "title": self.title,
-            "services": _services,
-            "workspace": [self.workspace.airtable_id],
-            "layers": _layers,
-            "styles": _styles,
-        }
+        return (
+            self.id,
+            self.name,
+            self.title,
+            self.services,
+            self.workspace.airtable_id,
+            [layer.airtable_id for layer in self.layers],
+            [style.airtable_id for style in self.styles],
+        )
 
     def __repr__(self) -> str:
         """
@@ -974,7 +1033,7 @@ class LayerGroupAirtable:
         :return: Whether an Airtable LayerGroup is effectively equal to another
         """
         # noinspection PyProtectedMember
-        return self._dict() == other._dict()
+        return self._key() == other._key()
 
 
 class ServersAirtable(Airtable):
@@ -985,7 +1044,7 @@ class ServersAirtable(Airtable):
     ItemClass = Server
     ItemClassAirtable = ServerAirtable
 
-    def __init__(self, airtable: _Airtable, servers: Servers, **kwargs):
+    def __init__(self, airtable: "_Airtable", servers: Servers, **kwargs):
         """
         :param airtable: upstream Airtable SDK class instance
         :param servers: collection of Server items
@@ -1001,7 +1060,7 @@ class NamespacesAirtable(Airtable):
     ItemClass = Namespace
     ItemClassAirtable = NamespaceAirtable
 
-    def __init__(self, airtable: _Airtable, namespaces: Namespaces, servers_airtable: ServersAirtable, **kwargs):
+    def __init__(self, airtable: "_Airtable", namespaces: Namespaces, servers_airtable: ServersAirtable, **kwargs):
         """
         :param airtable: upstream Airtable SDK class instance
         :param servers: collection of Namespace items
@@ -1020,7 +1079,7 @@ class RepositoriesAirtable(Airtable):
     ItemClassAirtable = RepositoryAirtable
 
     def __init__(
-        self, airtable: _Airtable, repositories: Repositories, namespaces_airtable: NamespacesAirtable, **kwargs
+        self, airtable: "_Airtable", repositories: Repositories, namespaces_airtable: NamespacesAirtable, **kwargs
     ):
         """
         :param airtable: upstream Airtable SDK class instance
@@ -1039,7 +1098,7 @@ class StylesAirtable(Airtable):
     ItemClass = Style
     ItemClassAirtable = StyleAirtable
 
-    def __init__(self, airtable: _Airtable, styles: Styles, namespaces_airtable: NamespacesAirtable, **kwargs):
+    def __init__(self, airtable: "_Airtable", styles: Styles, namespaces_airtable: NamespacesAirtable, **kwargs):
         """
         :param airtable: upstream Airtable SDK class instance
         :param styles: collection of Style items
@@ -1059,7 +1118,7 @@ class LayersAirtable(Airtable):
 
     def __init__(
         self,
-        airtable: _Airtable,
+        airtable: "_Airtable",
         layers: Layers,
         namespaces_airtable: NamespacesAirtable,
         repositories_airtable: RepositoriesAirtable,
@@ -1089,7 +1148,7 @@ class LayerGroupsAirtable(Airtable):
 
     def __init__(
         self,
-        airtable: _Airtable,
+        airtable: "_Airtable",
         layer_groups: LayerGroups,
         namespaces_airtable: NamespacesAirtable,
         styles_airtable: StylesAirtable,
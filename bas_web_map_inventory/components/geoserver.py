@@ -1,10 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import List, Dict, Tuple, Optional, Union
-
-# noinspection PyPackageRequirements
-from geoserver.catalog import Catalog as Catalogue
-from owslib.wfs import WebFeatureService
-from owslib.wms import WebMapService
+from functools import cached_property
+from typing import List, Dict, Tuple, Optional, Union, FrozenSet, Any, Callable, Iterable
 
 from bas_web_map_inventory.components import RepositoryType, LayerService, LayerGeometry, Server, ServerType
 from bas_web_map_inventory.utils import build_base_data_source_endpoint
@@ -72,6 +69,28 @@ class GeoServerGeometryColumnNames(Enum):
     THEGEOM = "the_geom"
 
 
+# Lookup tables for LayerGeometry values by GeoServer geometry (as a geometry property or geometry column type)
+_GEOSERVER_LAYER_GEOMETRIES: Dict[str, str] = {
+    member.value: LayerGeometry[member.name].value for member in GeoServerLayerGeometry
+}
+_GEOSERVER_PROPERTY_LAYER_GEOMETRIES: Dict[str, str] = {
+    member.value: LayerGeometry[member.name].value for member in GeoPropertyGeoServerLayerGeom
+}
+
+
+def _split_namespaced_label(label: str) -> Tuple[str, Optional[str]]:
+    """
+    Splits a GeoServer resource name, optionally prefixed with a workspace (e.g. 'workspace:layer'), into its parts
+
+    :param label: resource name, optionally prefixed with a workspace name and a ':' separator
+    :return: tuple of resource name and workspace name (or None if the resource name isn't prefixed with a workspace)
+    """
+    namespace_label, separator, _label = label.partition(":")
+    if not separator:
+        return namespace_label, None
+    return _label, namespace_label
+
+
 class GeoServer(Server):
     """
     Represents a server running GeoServer [1], an application that provides access to layers.
@@ -93,6 +112,9 @@ class GeoServer(Server):
     [4] https://pypi.org/project/OWSLib/
     """
 
+    # Number of concurrent requests used when getting details for multiple resources (e.g. all layers)
+    detail_workers: int = 16
+
     def __init__(
         self,
         server_id: str,
@@ -118,11 +140,19 @@ class GeoServer(Server):
         :param username: username for account to use for GeoServer API
         :param password: password for account to use for GeoServer API
         """
+        # noinspection PyPackageRequirements
+        from geoserver.catalog import Catalog as Catalogue
+        from owslib.wfs import WebFeatureService
+        from owslib.wms import WebMapService
+
         endpoint = build_base_data_source_endpoint(data_source={"hostname": hostname, "port": port})
 
-        self.client = Catalogue(service_url=f"{endpoint}{api_path}", username=username, password=password)
+        self._api_url = f"{endpoint}{api_path}"
+        self.client = Catalogue(service_url=self._api_url, username=username, password=password)
+        self._pool_catalogue_connections()
         self.wms = WebMapService(url=f"{endpoint}{wms_path}", version="1.3.0", username=username, password=password)
         self.wfs = WebFeatureService(url=f"{endpoint}{wfs_path}", version="2.0.0", username=username, password=password)
+        self._catalogue_items: Dict[Tuple, Any] = {}
 
         super().__init__(
             server_id=server_id,
@@ -132,6 +162,108 @@ class GeoServer(Server):
             version=self._get_geoserver_version(),
         )
 
+    def _pool_catalogue_connections(self) -> None:
+        """
+        Sizes the connection pool of the GeoServer API session to match the number of concurrent detail requests
+
+        geoserver-restconfig already uses a single (keep-alive) requests session per catalogue, however its default
+        pool holds fewer connections than `detail_workers`, causing surplus connections to be discarded and re-opened.
+        The existing retry policy is kept.
+        """
+        from requests.adapters import HTTPAdapter
+
+        session = getattr(self.client, "client", None)
+        if session is None:
+            return
+
+        adapter = session.get_adapter(self._api_url)
+        session.mount(
+            self._api_url.split("://", 1)[0] + "://",
+            HTTPAdapter(pool_maxsize=self.detail_workers, max_retries=adapter.max_retries),
+        )
+
+    @cached_property
+    def _workspaces(self) -> List[Any]:
+        """
+        All GeoServer workspaces
+
+        Computed once, on first use, as workspaces are needed when listing other resources (e.g. stores) as well as
+        namespaces themselves.
+
+        :return: list of GeoServer workspaces
+        """
+        return list(self.client.get_workspaces())
+
+    def _get_catalogue_item(self, item_type: str, **kwargs) -> Any:
+        """
+        Gets a specific item (e.g. a store) from the GeoServer admin API, reusing any previous result for the same item
+
+        Items are requested using the relevant geoserver-restconfig 'get_*' method (e.g. 'get_store') for the item type.
+
+        This method is called from the threads used by `_get_details`, without a lock. Two threads that need the same
+        uncached item at the same time may therefore both request it. This is accepted, rather than holding a lock
+        across requests: both results are the same item, the last one stored is kept, and reading or storing a single
+        dict item is thread safe.
+
+        :param item_type: type of GeoServer item (e.g. 'store')
+        :param kwargs: arguments for the relevant 'get_*' method (e.g. name and workspace)
+        :return: GeoServer item, or None if the item wasn't found
+        """
+        key = (item_type, *sorted(kwargs.items()))
+        if key not in self._catalogue_items:
+            self._catalogue_items[key] = getattr(self.client, f"get_{item_type}")(**kwargs)
+        return self._catalogue_items[key]
+
+    def _set_catalogue_item(self, item: Any, item_type: str, **kwargs) -> None:
+        """
+        Records an item (e.g. a store) already returned from the GeoServer admin API, for use by `_get_catalogue_item`
+
+        Used for items returned when listing all items of a type, which are the same objects the relevant
+        geoserver-restconfig 'get_*' method would return (e.g. 'get_store' lists all stores and returns a match).
+
+        :param item: GeoServer item
+        :param item_type: type of GeoServer item (e.g. 'store')
+        :param kwargs: arguments for the relevant 'get_*' method that would return this item (e.g. name and workspace)
+        """
+        self._catalogue_items[(item_type, *sorted(kwargs.items()))] = item
+
+    def _get_details(self, method: Callable, references: Iterable) -> List[Any]:
+        """
+        Gets details for multiple resources concurrently, using a thread pool
+
+        Details for each resource are independent, network bound, requests and so can overlap rather than being made
+        one after another. Results are returned in the same order as the references given. If getting details for any
+        resource fails, the first error (in order of references) is raised.
+
+        :param method: method to get details for a single resource (e.g. get_layer)
+        :param references: arguments for the method for each resource, as keyword arguments
+        :return: list of details for each resource
+        """
+        with ThreadPoolExecutor(max_workers=self.detail_workers) as executor:
+            return list(executor.map(lambda kwargs: method(**kwargs), references))
+
+    @cached_property
+    def _wms_contents(self) -> FrozenSet[str]:
+        """
+        Names of all layers available through the WMS endpoint
+
+        Computed once, on first use, so checking whether each layer is available through WMS is a set lookup.
+
+        :return: set of WMS layer names
+        """
+        return frozenset(self.wms.contents)
+
+    @cached_property
+    def _wfs_contents(self) -> FrozenSet[str]:
+        """
+        Names of all layers available through the WFS endpoint
+
+        Computed once, on first use, so checking whether each layer is available through WFS is a set lookup.
+
+        :return: set of WFS layer names
+        """
+        return frozenset(self.wfs.contents)
+
     def get_namespaces(self) -> List[str]:
         """
         Gets all GeoServer workspace names as Namespace labels
@@ -139,7 +271,8 @@ class GeoServer(Server):
         :return: list of Namespace labels
         """
         workspaces = []
-        for workspace in self.client.get_workspaces():
+        for workspace in self._workspaces:
+            self._set_catalogue_item(workspace, "workspace", name=workspace.name)
             workspaces.append(workspace.name)
         return workspaces
 
@@ -154,12 +287,24 @@ class GeoServer(Server):
 
         :return: dictionary of Namespace information that can be made into a Namespace object
         """
-        workspace = self.client.get_workspace(name=namespace_reference)
+        workspace = self._get_catalogue_item("workspace", name=namespace_reference)
         if workspace is None:
             raise KeyError(f"Namespace [{namespace_reference}] not found in server [{self.label}]")
 
         return {"label": workspace.name, "title": "-", "namespace": "-"}
 
+    def get_namespaces_detail(self, namespace_references: List[str]) -> List[Dict[str, str]]:
+        """
+        Gets multiple workspaces as Namespaces concurrently
+
+        :param namespace_references: list of Namespace labels (as returned by get_namespaces)
+        :return: list of dictionaries of Namespace information, in the same order as the references given
+        """
+        return self._get_details(
+            method=self.get_namespace,
+            references=[{"namespace_reference": namespace_reference} for namespace_reference in namespace_references],
+        )
+
     def get_repositories(self) -> List[Tuple[str, str]]:
         """
         Gets all GeoServer store names as Repository labels
@@ -169,7 +314,8 @@ class GeoServer(Server):
         stores = []
         # Passing workspaces here is a workaround for a bug in the get stores method where workspaces aren't specified.
         # The method says all workspaces should be checked but the logic to do this is in the wrong place so none are.
-        for store in self.client.get_stores(workspaces=self.client.get_workspaces()):
+        for store in self.client.get_stores(workspaces=self._workspaces):
+            self._set_catalogue_item(store, "store", name=store.name, workspace=store.workspace.name)
             stores.append((store.name, store.workspace.name))
         return stores
 
@@ -189,18 +335,17 @@ class GeoServer(Server):
         :param namespace_reference: Namespace (store) label (name)
         :return: dictionary of repository information that can be made into a Repository object
         """
-        _store = self.client.get_store(name=repository_reference, workspace=namespace_reference)
+        _store = self._get_catalogue_item("store", name=repository_reference, workspace=namespace_reference)
         if _store is None:
             raise KeyError(f"Repository [{repository_reference}] not found in server [{self.label}]")
 
+        _description = getattr(_store, "description", None)
         store = {
             "label": _store.name,
-            "title": "-",
+            "title": _description if _description is not None else "-",
             "repository_type": RepositoryType[GeoServerRepositoryType(str(_store.type).lower()).name].value,
             "namespace_label": _store.workspace.name,
         }
-        if hasattr(_store, "description") and _store.description is not None:
-            store["title"] = _store.description
 
         if (
             store["repository_type"] == RepositoryType.POSTGIS.value
@@ -211,6 +356,21 @@ class GeoServer(Server):
             store["schema"] = _store.connection_parameters["schema"]
         return store
 
+    def get_repositories_detail(self, repository_references: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+        """
+        Gets multiple stores as Repositories concurrently
+
+        :param repository_references: list of Repository:Namespace label tuples (as returned by get_repositories)
+        :return: list of dictionaries of repository information, in the same order as the references given
+        """
+        return self._get_details(
+            method=self.get_repository,
+            references=[
+                {"repository_reference": repository_reference, "namespace_reference": namespace_reference}
+                for repository_reference, namespace_reference in repository_references
+            ],
+        )
+
     def get_styles(self) -> List[Tuple[str, Optional[str]]]:
         """
         Gets all GeoServer style names as Style labels
@@ -241,7 +401,7 @@ class GeoServer(Server):
         :param namespace_reference: Namespace (store) label (name)
         :return: dictionary of style information that can be made into a Style object
         """
-        _style = self.client.get_style(name=style_reference, workspace=namespace_reference)
+        _style = self._get_catalogue_item("style", name=style_reference, workspace=namespace_reference)
 
         _type = str(_style.style_format).lower()
         if _type == "sld10":
@@ -252,11 +412,27 @@ class GeoServer(Server):
             "title": "-",
             "style_type": _type,
         }
-        if hasattr(_style, "workspace") and _style.workspace is not None:
-            style["namespace_label"] = _style.workspace
+        _workspace = getattr(_style, "workspace", None)
+        if _workspace is not None:
+            style["namespace_label"] = _workspace
 
         return style
 
+    def get_styles_detail(self, style_references: List[Tuple[str, Optional[str]]]) -> List[Dict[str, str]]:
+        """
+        Gets multiple styles as Styles concurrently
+
+        :param style_references: list of Style:Namespace label tuples (as returned by get_styles)
+        :return: list of dictionaries of style information, in the same order as the references given
+        """
+        return self._get_details(
+            method=self.get_style,
+            references=[
+                {"style_reference": style_reference, "namespace_reference": namespace_reference}
+                for style_reference, namespace_reference in style_references
+            ],
+        )
+
     def get_layers(self) -> List[str]:
         """
         Gets all GeoServer layer names as Layer labels
@@ -281,7 +457,7 @@ class GeoServer(Server):
         :param layer_reference: Layer (layer) label (name)
         :return: dictionary of layer information that can be made into a Layer object
         """
-        _layer = self.client.get_layer(name=layer_reference)
+        _layer = self._get_catalogue_item("layer", name=layer_reference)
 
         layer = {
             "label": _layer.resource.name,
@@ -295,24 +471,18 @@ class GeoServer(Server):
             "style_labels": [(_layer.default_style.name, _layer.default_style.workspace)],
         }
 
-        if layer_reference in list(self.wms.contents) or f"{_layer.resource.workspace.name}:{layer_reference}" in list(
-            self.wms.contents
-        ):
+        namespaced_layer_reference = f"{_layer.resource.workspace.name}:{layer_reference}"
+        if layer_reference in self._wms_contents or namespaced_layer_reference in self._wms_contents:
             layer["services"].append(LayerService.WMS.value)
 
-        if layer_reference in list(self.wfs.contents) or f"{_layer.resource.workspace.name}:{layer_reference}" in list(
-            self.wfs.contents
-        ):
+        if layer_reference in self._wfs_contents or namespaced_layer_reference in self._wfs_contents:
             layer["services"].append(LayerService.WFS.value)
 
             # WFS lookups don't seem to mind if the layer is namespaced or not
             _properties = self.wfs.get_schema(layer_reference)
             if "geometry" in _properties and isinstance(_properties["geometry"], str):
-                try:
-                    layer["geometry_type"] = LayerGeometry[
-                        GeoServerLayerGeometry(str(_properties["geometry"])).name
-                    ].value
-                except ValueError:
+                layer["geometry_type"] = _GEOSERVER_LAYER_GEOMETRIES.get(str(_properties["geometry"]))
+                if layer["geometry_type"] is None:
                     raise ValueError(
                         f"Geometry [{_properties['geometry']}] for layer {layer_reference} not mapped to "
                         f"LayerGeometry enum."
@@ -320,13 +490,10 @@ class GeoServer(Server):
             elif "properties" in _properties:
                 for geometry_column_name in GeoServerGeometryColumnNames:
                     if geometry_column_name.value in _properties["properties"].keys():
-                        try:
-                            layer["geometry_type"] = LayerGeometry[
-                                GeoPropertyGeoServerLayerGeom(
-                                    str(_properties["properties"][geometry_column_name.value])
-                                ).name
-                            ].value
-                        except ValueError:
+                        layer["geometry_type"] = _GEOSERVER_PROPERTY_LAYER_GEOMETRIES.get(
+                            str(_properties["properties"][geometry_column_name.value])
+                        )
+                        if layer["geometry_type"] is None:
                             raise ValueError(
                                 f"Geometry [{_properties['properties'][geometry_column_name.value]}] for layer "
                                 f"{layer_reference} in column '{geometry_column_name.value}' not mapped to "
@@ -341,6 +508,20 @@ class GeoServer(Server):
 
         return layer
 
+    def get_layers_detail(
+        self, layer_references: List[str]
+    ) -> List[Dict[str, Union[Optional[str], List[str], List[Tuple[str, Optional[str]]]]]]:
+        """
+        Gets multiple layers as Layers concurrently
+
+        :param layer_references: list of Layer labels (as returned by get_layers)
+        :return: list of dictionaries of layer information, in the same order as the references given
+        """
+        return self._get_details(
+            method=self.get_layer,
+            references=[{"layer_reference": layer_reference} for layer_reference in layer_references],
+        )
+
     def get_layer_groups(self) -> List[Tuple[str, Optional[str]]]:
         """
         Gets all GeoServer layer group names as LayerGroup labels
@@ -352,7 +533,10 @@ class GeoServer(Server):
         """
         layer_groups = []
 
-        for _layer_group in self.client.get_layergroups(workspaces=self.client.get_workspaces()):
+        for _layer_group in self.client.get_layergroups(workspaces=self._workspaces):
+            self._set_catalogue_item(
+                _layer_group, "layergroup", name=_layer_group.name, workspace=_layer_group.workspace
+            )
             layer_groups.append((_layer_group.name, _layer_group.workspace))
 
         return layer_groups
@@ -371,7 +555,7 @@ class GeoServer(Server):
         :param namespace_reference: Namespace (store) label (name)
         :return: dictionary of layer group information that can be made into a LayerGroup object
         """
-        _layer_group = self.client.get_layergroup(name=layer_group_reference, workspace=namespace_reference)
+        _layer_group = self._get_catalogue_item("layergroup", name=layer_group_reference, workspace=namespace_reference)
 
         layer_group = {
             "label": _layer_group.name,
@@ -381,32 +565,23 @@ class GeoServer(Server):
             "layer_labels": [],
             "style_labels": [],
         }
-        for layer_label in _layer_group.layers:
-            layer_label = layer_label.split(":")
-            if len(layer_label) == 2:
-                layer_group["layer_labels"].append((layer_label[1], layer_label[0]))
-            elif len(layer_label) == 1:
-                layer_group["layer_labels"].append((layer_label[0], None))
-
-        if f"{namespace_reference}:{layer_group_reference}" in list(self.wms.contents):
+        layer_group["layer_labels"] = [_split_namespaced_label(layer_label) for layer_label in _layer_group.layers]
+
+        if f"{namespace_reference}:{layer_group_reference}" in self._wms_contents:
             layer_group["services"].append(LayerService.WMS.value)
-        if f"{namespace_reference}:{layer_group_reference}" in list(self.wfs.contents):
+        if f"{namespace_reference}:{layer_group_reference}" in self._wfs_contents:
             layer_group["services"].append(LayerService.WFS.value)
             _properties = self.wfs.get_schema(f"{namespace_reference}:{layer_group_reference}")
-            try:
-                layer_group["geometry_type"] = LayerGeometry[
-                    GeoServerLayerGeometry(str(_properties["geometry"])).name
-                ].value
-            except ValueError:
+            layer_group["geometry_type"] = _GEOSERVER_LAYER_GEOMETRIES.get(str(_properties["geometry"]))
+            if layer_group["geometry_type"] is None:
                 raise ValueError(f"Geometry [{_properties['geometry']}] not mapped to LayerGeometry enum.")
 
-        for style_label in _layer_group.styles:
-            if style_label is not None:
-                style_label = style_label.split(":")
-                if len(style_label) == 2 and (style_label[1], style_label[0]) not in layer_group["style_labels"]:
-                    layer_group["style_labels"].append((style_label[1], style_label[0]))
-                if len(style_label) == 1 and (style_label[0], None) not in layer_group["style_labels"]:
-                    layer_group["style_labels"].append((style_label[0], None))
+        # Layer groups list a style for each layer, so styles are de-duplicated (whilst preserving order)
+        layer_group["style_labels"] = list(
+            dict.fromkeys(
+                _split_namespaced_label(style_label) for style_label in _layer_group.styles if style_label is not None
+            )
+        )
 
         return layer_group
 
@@ -417,3 +592,20 @@ class GeoServer(Server):
         :return: GeoServer version string
         """
         return self.client.get_version()
+
+    def get_layer_groups_detail(
+        self, layer_group_references: List[Tuple[str, Optional[str]]]
+    ) -> List[Dict[str, Union[Optional[str], List[str], List[Tuple[str, Optional[str]]]]]]:
+        """
+        Gets multiple layer groups as LayerGroups concurrently
+
+        :param layer_group_references: list of LayerGroup:Namespace label tuples (as returned by get_layer_groups)
+        :return: list of dictionaries of layer group information, in the same order as the references given
+        """
+        return self._get_details(
+            method=self.get_layer_group,
+            references=[
+                {"layer_group_reference": layer_group_reference, "namespace_reference": namespace_reference}
+                for layer_group_reference, namespace_reference in layer_group_references
+            ],
+        )
@@ -1,16 +1,47 @@
 import logging
 import os
 
-import pkg_resources
-
-from typing import Dict
+from functools import lru_cache
+from importlib.metadata import version as package_version
+from typing import Dict, Optional
 from pathlib import Path
 
 from flask.cli import load_dotenv
-from sentry_sdk.integrations.flask import FlaskIntegration
 from str2bool import str2bool
 
 
+@lru_cache(maxsize=None)
+def _load_dotenv() -> None:
+    """
+    Loads environment files (e.g. '.env' and '.flaskenv') into environment variables, once per process
+
+    Environment files don't override variables that are already set, so loading them again (e.g. for each app created
+    in tests) would only re-read and re-parse them for no effect.
+    """
+    load_dotenv()
+
+
+def _get_bool_env(name: str, default: bool) -> bool:
+    """
+    Gets a boolean value from an environment variable
+
+    Values are parsed using str2bool (e.g. 'true', 'yes', '1'). Where a variable isn't set, or its value isn't a
+    recognised boolean, the default value is returned.
+
+    :param name: environment variable name
+    :param default: value to use if the environment variable isn't set or isn't a recognised boolean
+    :return: environment variable value as a boolean
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+
+    _value = str2bool(value)
+    if _value is None:
+        return default
+    return _value
+
+
 class Config:
     """
     Flask configuration base class
@@ -21,7 +52,6 @@ class Config:
     See the project README for configuration option details.
     """
 
-    ENV = os.environ.get("FLASK_ENV")
     DEBUG = False
     TESTING = False
 
@@ -29,19 +59,40 @@ class Config:
 
     LOGGING_LEVEL = logging.WARNING
 
+    # Name reported to Sentry for the server the app runs on, if not the hostname (set by environment specific configs)
+    _sentry_server_name: Optional[str] = None
+
+    __slots__ = (
+        "ENV",
+        "APP_ENABLE_FILE_LOGGING",
+        "APP_ENABLE_SENTRY",
+        "LOG_FORMAT",
+        "LOG_FILE_PATH",
+        "SENTRY_DSN",
+        "AIRTABLE_API_KEY",
+        "AIRTABLE_BASE_ID",
+        "_sentry_config",
+    )
+
     def __init__(self):
-        load_dotenv()
+        _load_dotenv()
+        env = os.environ
+
+        # Read here, rather than when this module is imported, so values from environment files are used
+        self.ENV = env.get("FLASK_ENV")
 
-        self.APP_ENABLE_FILE_LOGGING = str2bool(os.environ.get("APP_ENABLE_FILE_LOGGING")) or False
-        self.APP_ENABLE_SENTRY = str2bool(os.environ.get("APP_ENABLE_SENTRY")) or True
+        self.APP_ENABLE_FILE_LOGGING = _get_bool_env(name="APP_ENABLE_FILE_LOGGING", default=False)
+        self.APP_ENABLE_SENTRY = _get_bool_env(name="APP_ENABLE_SENTRY", default=True)
 
         self.LOG_FORMAT = "[%(asctime)s] %(levelname)s [%(name)s.%(funcName)s:%(lineno)d] %(message)s"
-        self.LOG_FILE_PATH = Path(os.environ.get("APP_LOG_FILE_PATH") or "/var/log/app/app.log")
+        self.LOG_FILE_PATH = Path(env.get("APP_LOG_FILE_PATH") or "/var/log/app/app.log")
+
+        self.SENTRY_DSN = env.get("SENTRY_DSN")
 
-        self.SENTRY_DSN = os.environ.get("SENTRY_DSN") or None
+        self.AIRTABLE_API_KEY = env.get("AIRTABLE_API_KEY")
+        self.AIRTABLE_BASE_ID = env.get("AIRTABLE_BASE_ID")
 
-        self.AIRTABLE_API_KEY = os.environ.get("AIRTABLE_API_KEY")
-        self.AIRTABLE_BASE_ID = os.environ.get("AIRTABLE_BASE_ID")
+        self._sentry_config: Optional[Dict] = None
 
     # noinspection PyPep8Naming
     @property
@@ -51,12 +102,23 @@ class Config:
     # noinspection PyPep8Naming
     @property
     def SENTRY_CONFIG(self) -> Dict:
-        return {
-            "dsn": self.SENTRY_DSN,
-            "integrations": [FlaskIntegration()],
-            "environment": self.ENV,
-            "release": f"{self.NAME}@{self.VERSION}",
-        }
+        # Built once per instance, rather than creating a new Flask integration (and looking up the version) each time
+        if self._sentry_config is None:
+            integrations = []
+            if self.APP_ENABLE_SENTRY:
+                from sentry_sdk.integrations.flask import FlaskIntegration
+
+                integrations.append(FlaskIntegration())
+
+            self._sentry_config = {
+                "dsn": self.SENTRY_DSN,
+                "integrations": integrations,
+                "environment": self.ENV,
+                "release": f"{self.NAME}@{self.VERSION}",
+            }
+            if self._sentry_server_name is not None:
+                self._sentry_config["server_name"] = self._sentry_server_name
+        return self._sentry_config
 
 
 class ProductionConfig(Config):  # pragma: no cover
@@ -66,14 +128,21 @@ class ProductionConfig(Config):  # pragma: no cover
     Note: This method is excluded from test coverage as its meaning would be undermined.
     """
 
+    __slots__ = ("_version",)
+
     def __init__(self):
         super().__init__()
-        self.APP_ENABLE_FILE_LOGGING = str2bool(os.environ.get("APP_ENABLE_FILE_LOGGING")) or True
+        self.APP_ENABLE_FILE_LOGGING = _get_bool_env(name="APP_ENABLE_FILE_LOGGING", default=True)
+
+        self._version: Optional[str] = None
 
     # noinspection PyPep8Naming
     @property
     def VERSION(self) -> str:
-        return pkg_resources.require("bas-web-map-inventory")[0].version
+        # Looked up once per instance, from installed package metadata
+        if self._version is None:
+            self._version = package_version("bas-web-map-inventory")
+        return self._version
 
 
 class DevelopmentConfig(Config):  # pragma: no cover
@@ -85,18 +154,15 @@ class DevelopmentConfig(Config):  # pragma: no cover
 
     DEBUG = True
 
-    @property
-    def SENTRY_CONFIG(self) -> Dict:
-        _config = super().SENTRY_CONFIG
-        _config["server_name"] = "Local container"
+    LOGGING_LEVEL = logging.INFO
 
-        return _config
+    _sentry_server_name = "Local container"
 
-    LOGGING_LEVEL = logging.INFO
+    __slots__ = ()
 
     def __init__(self):
         super().__init__()
-        self.APP_ENABLE_SENTRY = str2bool(os.environ.get("APP_ENABLE_SENTRY")) or False
+        self.APP_ENABLE_SENTRY = _get_bool_env(name="APP_ENABLE_SENTRY", default=False)
 
     # noinspection PyPep8Naming
     @property
@@ -114,6 +180,8 @@ class TestingConfig(Config):
 
     LOGGING_LEVEL = logging.DEBUG
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.APP_ENABLE_FILE_LOGGING = False
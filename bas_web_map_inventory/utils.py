@@ -4,16 +4,11 @@
 import subprocess  # nosec
 
 from enum import Enum
+from functools import lru_cache
 from tempfile import NamedTemporaryFile
-from typing import List
+from typing import Any, List
 from importlib import resources
 
-# Exempting Bandit security issue (Using lxml.etree.parse to parse untrusted XML data)
-#
-# see specific reasons below
-# noinspection PyUnresolvedReferences
-from lxml import etree  # nosec
-
 
 class OGCProtocol(Enum):
     """
@@ -23,6 +18,24 @@ class OGCProtocol(Enum):
     WMS = "wms"
 
 
+@lru_cache(maxsize=None)
+def _get_ogc_schema(schema_file: str) -> Any:
+    """
+    Loads and compiles an XML Schema for validating OGC documents
+
+    Compiling the (large) OGC schemas is much slower than validating a typical document against them, so each schema is
+    compiled once and reused for later validations.
+
+    :param schema_file: file name of an XML Schema in the application's XML Schemas resources package
+    :return: compiled XML Schema (an lxml XMLSchema instance)
+    """
+    from lxml import etree  # nosec
+
+    with resources.path("bas_web_map_inventory.resources.xml_schemas", schema_file) as schema_file_path:
+        schema = etree.parse(str(schema_file_path)).getroot()
+    return etree.XMLSchema(schema)
+
+
 def validate_ogc_capabilities(
     ogc_protocol: OGCProtocol, capabilities_url: str, multiple_errors: bool = False
 ) -> List[str]:
@@ -64,15 +77,17 @@ def validate_ogc_capabilities(
 
     :return: A list of validation errors, empty if the GetCapabilities is valid
     """
+    # Exempting Bandit security issue (Using lxml.etree.parse to parse untrusted XML data)
+    #
+    # see specific reasons below
+    # noinspection PyUnresolvedReferences
+    from lxml import etree  # nosec
+
     if ogc_protocol == OGCProtocol.WMS:
         schema_file = "wms-1.3.0.xsd"
     else:
         raise ValueError("Invalid or unsupported OGC protocol")
 
-    with resources.path("bas_web_map_inventory.resources.xml_schemas", schema_file) as schema_file_path:
-        schema = etree.parse(str(schema_file_path)).getroot()
-    validator = etree.XMLSchema(schema)
-
     # Exempting Bandit security issue (Using lxml.etree.parse to parse untrusted XML data)
     #
     # Only URLs added for data sources will be checked by this method. It is assumed such data sources will either be
@@ -82,7 +97,7 @@ def validate_ogc_capabilities(
 
     if not multiple_errors:
         try:
-            validator.assertValid(capabilities_instance)
+            _get_ogc_schema(schema_file=schema_file).assertValid(capabilities_instance)
             return list()
         except etree.DocumentInvalid as e:
             return [e.args[0]]
@@ -1,3 +1,5 @@
+import re
+
 from argparse import ArgumentParser
 from sys import stdout, stderr
 
@@ -54,6 +56,11 @@ The components in this version string are:
 """
 
 
+# 'git describe --tags' output, either a tag (e.g. 'v0.3.0') or a tag, distance and abbreviated commit hash (e.g.
+# 'v0.3.0-5-g345C2B1'). Tags may themselves contain '-' characters (e.g. 'v0.3.0-rc1').
+GIT_DESCRIBE_PATTERN = re.compile(r"^v?(?P<tag>.+?)(?:-(?P<distance>\d+)-g[0-9a-fA-F]+)?$")
+
+
 if __name__ == "__main__":
     parser = ArgumentParser()
     parser.add_argument('git_describe', help='Output of running `git describe --tags`')
@@ -64,17 +71,15 @@ if __name__ == "__main__":
 
     version_string = ''
 
-    version_elements = str(args.git_describe).split('-')
-    if len(version_elements) == 1:
-        version_string = version_elements[0].replace('v', '')
-    elif len(version_elements) == 3:
-        tag = version_elements[0].replace('v', '')
-        distance = version_elements[1]
-        version_string = f"{tag}.post{distance}.dev0"
-    else:
+    version_elements = GIT_DESCRIBE_PATTERN.match(str(args.git_describe))
+    if version_elements is None:
         error = True
-        stderr.write('Error: invalid number of elements')
+        stderr.write('Error: invalid git describe output')
         exit(1)
+    elif version_elements['distance'] is None:
+        version_string = version_elements['tag']
+    else:
+        version_string = f"{version_elements['tag']}.post{version_elements['distance']}.dev0"
 
     if args.update_pyproject:
         from pathlib import Path
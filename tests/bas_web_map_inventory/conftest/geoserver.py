@@ -101,7 +101,11 @@ class MockGeoServerCatalogue:
         """
         stores = []
         for store in self.stores:
-            stores.append(MockGeoserverCatalogueStore(name=store['name'], workspace=store['workspace_name']))
+            stores.append(MockGeoserverCatalogueStore(
+                name=store['name'],
+                workspace=store['workspace_name'],
+                description=store.get('description')
+            ))
 
         return stores
 
@@ -658,3 +658,22 @@ def test_airtable_reset_command(app, app_runner):
                result.output
         assert "{'current': [], 'outdated': [], 'missing': ['01DRS53XAH7TB65G8BBQZGMHYB'], 'orphaned': []}" in\
                result.output
+
+
+def test_airtable_status_no_refresh():
+    airtable_data = [deepcopy(test_server_data_airtable)]
+    # noinspection PyTypeChecker
+    airtable = ServersAirtable(
+        airtable=MockAirtable(base_key='test', api_key='test', table_name='Servers', data=airtable_data),
+        servers=deepcopy(test_servers)
+    )
+
+    airtable.reset()
+
+    status = airtable.status(refresh=False)
+    assert len(status['current']) == 1
+    assert len(status['missing']) == 0
+
+    status = airtable.status()
+    assert len(status['current']) == 0
+    assert len(status['missing']) == 1
@@ -57,6 +57,16 @@ def test_app_enable_sentry():
         assert app.config['APP_ENABLE_SENTRY'] is True
 
 
+@pytest.mark.parametrize(
+    argnames=['value', 'expected'],
+    argvalues=[('true', True), ('false', False), ('invalid', True)]
+)
+def test_app_enable_sentry_environment_variable(value, expected):
+    with patch.dict('os.environ', {'APP_ENABLE_SENTRY': value}):
+        config = Config()
+        assert config.APP_ENABLE_SENTRY is expected
+
+
 @pytest.mark.usefixtures('app_runner')
 def test_cli_help(app_runner):
     result = app_runner.invoke(args=['--help'])
@@ -1,6 +1,7 @@
 import pytest
 
-from copy import deepcopy
+from copy import copy, deepcopy
+from time import sleep
 from unittest.mock import patch
 
 from bas_web_map_inventory.components import Server, Namespace, Repository, Style, Layer, LayerGroup, Servers, \
@@ -11,7 +12,7 @@ from tests.bas_web_map_inventory.conftest.components import test_server_data, te
     test_namespace, test_repository_data, test_repository, test_style_data, test_style, test_layer_data, test_layer, \
     test_layer_group_data, test_layer_group
 from tests.bas_web_map_inventory.conftest.geoserver import test_geoserver_data, test_geoserver_catalogue_data, \
-    geoserver_geometry_column_names
+    test_geoserver_wfs_data, geoserver_geometry_column_names
 
 
 @pytest.mark.parametrize(
@@ -96,152 +97,276 @@ def test_generic_components_get_by_label_layer_namespace():
     assert str(item) == 'Layer <id=01DRS53XAHN84G0NE0YJJRWVKA, label=test-layer-1, type=LayerType.VECTOR>'
 
 
-@pytest.mark.usefixtures('geoserver_catalogue', 'wms_client', 'wfs_client')
-def test_geoserver_component(geoserver_catalogue, wms_client, wfs_client):
-    with patch('bas_web_map_inventory.components.geoserver.Catalogue') as mock_geoserver_catalogue, \
-            patch('bas_web_map_inventory.components.geoserver.WebMapService') as mock_wms_client, \
-            patch('bas_web_map_inventory.components.geoserver.WebFeatureService') as mock_wfs_client:
-        mock_geoserver_catalogue.return_value = geoserver_catalogue
-        mock_wms_client.return_value = wms_client
-        mock_wfs_client.return_value = wfs_client
-
-        item = GeoServer(**test_geoserver_data)
-        assert isinstance(item, GeoServer)
-
-        collection = Servers()
-        collection['test'] = item
-        assert isinstance(collection, Servers)
-        assert len(collection) == 1
-
-
-@pytest.mark.usefixtures('geoserver_catalogue', 'wms_client', 'wfs_client')
-def test_geoserver_component_unknown_workspace(geoserver_catalogue, wms_client, wfs_client):
-    with patch('bas_web_map_inventory.components.geoserver.Catalogue') as mock_geoserver_catalogue, \
-            patch('bas_web_map_inventory.components.geoserver.WebMapService') as mock_wms_client, \
-            patch('bas_web_map_inventory.components.geoserver.WebFeatureService') as mock_wfs_client:
-        mock_geoserver_catalogue.return_value = geoserver_catalogue
-        mock_wms_client.return_value = wms_client
-        mock_wfs_client.return_value = wfs_client
-
-        item = GeoServer(**test_geoserver_data)
-        # These `populate()` methods are only defined in mock classes
-        # noinspection PyUnresolvedReferences
-        item.client.populate(data=test_geoserver_catalogue_data)
-        # noinspection PyUnresolvedReferences
-        item.wfs.populate(contents={'test-layer-1': {'geometry': 'point'}})
-        assert isinstance(item, GeoServer)
-
-        with pytest.raises(KeyError) as e:
-            item.get_namespace(namespace_reference='invalid-namespace')
-        assert 'Namespace [invalid-namespace] not found in server [test-server-1]' in str(e.value)
-
-
-@pytest.mark.usefixtures('geoserver_catalogue', 'wms_client', 'wfs_client')
-def test_geoserver_component_unknown_store(geoserver_catalogue, wms_client, wfs_client):
-    with patch('bas_web_map_inventory.components.geoserver.Catalogue') as mock_geoserver_catalogue, \
-            patch('bas_web_map_inventory.components.geoserver.WebMapService') as mock_wms_client, \
-            patch('bas_web_map_inventory.components.geoserver.WebFeatureService') as mock_wfs_client:
-        mock_geoserver_catalogue.return_value = geoserver_catalogue
-        mock_wms_client.return_value = wms_client
-        mock_wfs_client.return_value = wfs_client
-
-        item = GeoServer(**test_geoserver_data)
-        # These `populate()` methods are only defined in mock classes
-        # noinspection PyUnresolvedReferences
-        item.client.populate(data=test_geoserver_catalogue_data)
-        # noinspection PyUnresolvedReferences
-        item.wfs.populate(contents={'test-layer-1': {'geometry': 'point'}})
-        assert isinstance(item, GeoServer)
-
-        with pytest.raises(KeyError) as e:
-            item.get_repository(repository_reference='invalid-repository', namespace_reference='invalid-namespace')
-        assert f"Repository [invalid-repository] not found in server [test-server-1]" in str(e.value)
-
-
-@pytest.mark.usefixtures('geoserver_catalogue', 'wms_client', 'wfs_client')
-def test_geoserver_component_unknown_geometry(geoserver_catalogue, wms_client, wfs_client):
-    with patch('bas_web_map_inventory.components.geoserver.Catalogue') as mock_geoserver_catalogue, \
-            patch('bas_web_map_inventory.components.geoserver.WebMapService') as mock_wms_client, \
-            patch('bas_web_map_inventory.components.geoserver.WebFeatureService') as mock_wfs_client:
-        mock_geoserver_catalogue.return_value = geoserver_catalogue
-        mock_wms_client.return_value = wms_client
-        mock_wfs_client.return_value = wfs_client
-
-        item = GeoServer(**test_geoserver_data)
-        # These `populate()` methods are only defined in mock classes
-        # noinspection PyUnresolvedReferences
-        item.client.populate(data=test_geoserver_catalogue_data)
-        # noinspection PyUnresolvedReferences
-        item.wfs.populate(contents={
-            'test-layer-1': {'geometry': 'invalid'},
-            'test-namespace-1:test-layer-group-1': {'geometry': 'invalid'}
-        })
-        assert isinstance(item, GeoServer)
-
-        with pytest.raises(ValueError) as e:
-            item.get_layer(layer_reference='test-layer-1')
-        assert f"Geometry [invalid] for layer test-layer-1 not mapped to LayerGeometry enum." in str(e.value)
-
-        with pytest.raises(ValueError) as e:
-            item.get_layer_group(
-                layer_group_reference=test_geoserver_catalogue_data['layer_groups'][0]['name'],
-                namespace_reference=test_geoserver_catalogue_data['layer_groups'][0]['workspace_name']
-            )
-        assert f"Geometry [invalid] not mapped to LayerGeometry enum." in str(e.value)
+@pytest.mark.parametrize(
+    argnames=['component', 'component_item'],
+    argvalues=[
+        (Namespaces, test_namespace),
+        (Repositories, test_repository),
+        (Styles, test_style),
+        (Layers, test_layer)
+    ]
+)
+def test_generic_components_get_by_label_index(component, component_item):
+    collection = component({'test': component_item})
+    assert collection.get_by_label(label=component_item.label) is component_item
+    del collection['test']
+    assert collection.get_by_label(label=component_item.label) is None
+    collection.update(test=component_item)
+    assert collection.get_by_label(label=component_item.label) is component_item
+
+
+@pytest.mark.parametrize(
+    argnames=['component', 'component_item'],
+    argvalues=[
+        (Namespaces, test_namespace),
+        (Repositories, test_repository),
+        (Styles, test_style),
+        (Layers, test_layer)
+    ]
+)
+def test_generic_components_get_by_label_index_dict_methods(component, component_item):
+    label = component_item.label
+
+    collection = component()
+    assert collection.setdefault('test', component_item) is component_item
+    assert collection.get_by_label(label=label) is component_item
+    assert collection.pop('test') is component_item
+    assert collection.get_by_label(label=label) is None
+    assert collection.pop('test', None) is None
+
+    collection |= {'test': component_item}
+    assert collection.get_by_label(label=label) is component_item
+    assert collection.popitem() == ('test', component_item)
+    assert collection.get_by_label(label=label) is None
+
+    collection['test'] = component_item
+    collection.clear()
+    assert collection.get_by_label(label=label) is None
+
+
+@pytest.mark.parametrize(
+    argnames=['component', 'component_item'],
+    argvalues=[
+        (Namespaces, test_namespace),
+        (Repositories, test_repository),
+        (Styles, test_style),
+        (Layers, test_layer)
+    ]
+)
+def test_generic_components_get_by_label_index_duplicate_labels(component, component_item):
+    label = component_item.label
+    duplicate_item = copy(component_item)
+
+    collection = component({'test-1': component_item, 'test-2': duplicate_item})
+    assert collection.get_by_label(label=label) is component_item
+    collection['test-2'] = duplicate_item
+    assert collection.get_by_label(label=label) is component_item
+    del collection['test-1']
+    assert collection.get_by_label(label=label) is duplicate_item
+    collection['test-1'] = component_item
+    assert collection.get_by_label(label=label) is duplicate_item
+    collection['test-2'] = component_item
+    assert collection.get_by_label(label=label) is component_item
+    assert collection.popitem() == ('test-1', component_item)
+    assert collection.get_by_label(label=label) is component_item
+    collection.pop('test-2')
+    assert collection.get_by_label(label=label) is None
+
+
+@pytest.mark.usefixtures('patched_geoserver')
+def test_geoserver_component(patched_geoserver):
+    item = GeoServer(**test_geoserver_data)
+    assert isinstance(item, GeoServer)
+
+    collection = Servers()
+    collection['test'] = item
+    assert isinstance(collection, Servers)
+    assert len(collection) == 1
+
+
+@pytest.mark.usefixtures('patched_geoserver')
+def test_geoserver_component_unknown_workspace(patched_geoserver):
+    item = GeoServer(**test_geoserver_data)
+    # These `populate()` methods are only defined in mock classes
+    # noinspection PyUnresolvedReferences
+    item.client.populate(data=test_geoserver_catalogue_data)
+    # noinspection PyUnresolvedReferences
+    item.wfs.populate(contents={'test-layer-1': {'geometry': 'point'}})
+    assert isinstance(item, GeoServer)
+
+    with pytest.raises(KeyError) as e:
+        item.get_namespace(namespace_reference='invalid-namespace')
+    assert 'Namespace [invalid-namespace] not found in server [test-server-1]' in str(e.value)
+
+
+@pytest.mark.usefixtures('patched_geoserver')
+def test_geoserver_component_unknown_store(patched_geoserver):
+    item = GeoServer(**test_geoserver_data)
+    # These `populate()` methods are only defined in mock classes
+    # noinspection PyUnresolvedReferences
+    item.client.populate(data=test_geoserver_catalogue_data)
+    # noinspection PyUnresolvedReferences
+    item.wfs.populate(contents={'test-layer-1': {'geometry': 'point'}})
+    assert isinstance(item, GeoServer)
+
+    with pytest.raises(KeyError) as e:
+        item.get_repository(repository_reference='invalid-repository', namespace_reference='invalid-namespace')
+    assert f"Repository [invalid-repository] not found in server [test-server-1]" in str(e.value)
+
+
+@pytest.mark.usefixtures('patched_geoserver')
+def test_geoserver_component_unknown_geometry(patched_geoserver):
+    item = GeoServer(**test_geoserver_data)
+    # These `populate()` methods are only defined in mock classes
+    # noinspection PyUnresolvedReferences
+    item.client.populate(data=test_geoserver_catalogue_data)
+    # noinspection PyUnresolvedReferences
+    item.wfs.populate(contents={
+        'test-layer-1': {'geometry': 'invalid'},
+        'test-namespace-1:test-layer-group-1': {'geometry': 'invalid'}
+    })
+    assert isinstance(item, GeoServer)
+
+    with pytest.raises(ValueError) as e:
+        item.get_layer(layer_reference='test-layer-1')
+    assert f"Geometry [invalid] for layer test-layer-1 not mapped to LayerGeometry enum." in str(e.value)
+
+    with pytest.raises(ValueError) as e:
+        item.get_layer_group(
+            layer_group_reference=test_geoserver_catalogue_data['layer_groups'][0]['name'],
+            namespace_reference=test_geoserver_catalogue_data['layer_groups'][0]['workspace_name']
+        )
+    assert f"Geometry [invalid] not mapped to LayerGeometry enum." in str(e.value)
 
 
 @pytest.mark.parametrize(
     argnames=['_property'],
     argvalues=geoserver_geometry_column_names()
 )
-@pytest.mark.usefixtures('geoserver_catalogue', 'wms_client', 'wfs_client')
-def test_geoserver_component_unknown_geometry_property(_property, geoserver_catalogue, wms_client, wfs_client):
-    with patch('bas_web_map_inventory.components.geoserver.Catalogue') as mock_geoserver_catalogue, \
-            patch('bas_web_map_inventory.components.geoserver.WebMapService') as mock_wms_client, \
-            patch('bas_web_map_inventory.components.geoserver.WebFeatureService') as mock_wfs_client:
-        mock_geoserver_catalogue.return_value = geoserver_catalogue
-        mock_wms_client.return_value = wms_client
-        mock_wfs_client.return_value = wfs_client
-
-        item = GeoServer(**test_geoserver_data)
-        # These `populate()` methods are only defined in mock classes
-        # noinspection PyUnresolvedReferences
-        item.client.populate(data=test_geoserver_catalogue_data)
-        # noinspection PyUnresolvedReferences
-        item.wfs.populate(contents={
-            'test-layer-1': {'properties': {_property: 'invalid'}}
-        })
-        assert isinstance(item, GeoServer)
-
-        with pytest.raises(ValueError) as e:
-            item.get_layer(layer_reference='test-layer-1')
-        assert f"Geometry [invalid] for layer test-layer-1 in column '{_property}' not mapped to " \
-               f"LayerGeometry enum." in str(e.value)
-
-
-@pytest.mark.usefixtures('geoserver_catalogue', 'wms_client', 'wfs_client')
-def test_geoserver_component_layer_group_namespaced_labels(geoserver_catalogue, wms_client, wfs_client):
-    with patch('bas_web_map_inventory.components.geoserver.Catalogue') as mock_geoserver_catalogue, \
-            patch('bas_web_map_inventory.components.geoserver.WebMapService') as mock_wms_client, \
-            patch('bas_web_map_inventory.components.geoserver.WebFeatureService') as mock_wfs_client:
-        mock_geoserver_catalogue.return_value = geoserver_catalogue
-        mock_wms_client.return_value = wms_client
-        mock_wfs_client.return_value = wfs_client
-
-        item = GeoServer(**test_geoserver_data)
-        # These `populate()` methods are only defined in mock classes
-        # noinspection PyUnresolvedReferences
-        data = deepcopy(test_geoserver_catalogue_data)
-        data['layer_groups'][0]['layer_names'] = ['test-namespace-1:test-layer-1']
-        data['layer_groups'][0]['style_names'] = ['test-namespace-1:test-style-1']
-        item.client.populate(data=data)
-        # noinspection PyUnresolvedReferences
-        item.wfs.populate(contents={'test-layer-1': {'geometry': 'point'}})
-        assert isinstance(item, GeoServer)
-
-        result = item.get_layer_group(
-            layer_group_reference=data['layer_groups'][0]['name'],
-            namespace_reference=data['layer_groups'][0]['workspace_name']
+@pytest.mark.usefixtures('patched_geoserver')
+def test_geoserver_component_unknown_geometry_property(_property, patched_geoserver):
+    item = GeoServer(**test_geoserver_data)
+    # These `populate()` methods are only defined in mock classes
+    # noinspection PyUnresolvedReferences
+    item.client.populate(data=test_geoserver_catalogue_data)
+    # noinspection PyUnresolvedReferences
+    item.wfs.populate(contents={
+        'test-layer-1': {'properties': {_property: 'invalid'}}
+    })
+    assert isinstance(item, GeoServer)
+
+    with pytest.raises(ValueError) as e:
+        item.get_layer(layer_reference='test-layer-1')
+    assert f"Geometry [invalid] for layer test-layer-1 in column '{_property}' not mapped to " \
+           f"LayerGeometry enum." in str(e.value)
+
+
+@pytest.mark.usefixtures('patched_geoserver')
+def test_geoserver_component_layer_group_namespaced_labels(patched_geoserver):
+    item = GeoServer(**test_geoserver_data)
+    # These `populate()` methods are only defined in mock classes
+    # noinspection PyUnresolvedReferences
+    data = deepcopy(test_geoserver_catalogue_data)
+    data['layer_groups'][0]['layer_names'] = ['test-namespace-1:test-layer-1']
+    data['layer_groups'][0]['style_names'] = ['test-namespace-1:test-style-1']
+    item.client.populate(data=data)
+    # noinspection PyUnresolvedReferences
+    item.wfs.populate(contents={'test-layer-1': {'geometry': 'point'}})
+    assert isinstance(item, GeoServer)
+
+    result = item.get_layer_group(
+        layer_group_reference=data['layer_groups'][0]['name'],
+        namespace_reference=data['layer_groups'][0]['workspace_name']
+    )
+    assert result is not None
+    assert result['layer_labels'][0] == ('test-layer-1', 'test-namespace-1')
+
+
+@pytest.mark.usefixtures('patched_geoserver')
+def test_geoserver_component_listed_items_reused(patched_geoserver):
+    item = GeoServer(**test_geoserver_data)
+    # These `populate()` methods are only defined in mock classes
+    # noinspection PyUnresolvedReferences
+    item.client.populate(data=test_geoserver_catalogue_data)
+    namespace_label = item.get_namespaces()[0]
+    repository_label, repository_namespace_label = item.get_repositories()[0]
+
+    with patch.object(item.client, 'get_workspace') as mock_get_workspace, \
+            patch.object(item.client, 'get_store') as mock_get_store:
+        assert item.get_namespace(namespace_reference=namespace_label)['label'] == namespace_label
+        assert item.get_repository(
+            repository_reference=repository_label,
+            namespace_reference=repository_namespace_label
+        )['label'] == repository_label
+        mock_get_workspace.assert_not_called()
+        mock_get_store.assert_not_called()
+
+
+@pytest.mark.usefixtures('patched_geoserver')
+def test_geoserver_component_details(patched_geoserver):
+    item = GeoServer(**test_geoserver_data)
+    # These `populate()` methods are only defined in mock classes
+    # noinspection PyUnresolvedReferences
+    item.client.populate(data=test_geoserver_catalogue_data)
+    # noinspection PyUnresolvedReferences
+    item.wfs.populate(contents=test_geoserver_wfs_data)
+
+    namespaces = item.get_namespaces()
+    assert item.get_namespaces_detail(namespace_references=namespaces) == [
+        item.get_namespace(namespace_reference=namespace) for namespace in namespaces
+    ]
+    repositories = item.get_repositories()
+    assert item.get_repositories_detail(repository_references=repositories) == [
+        item.get_repository(repository_reference=repository, namespace_reference=namespace)
+        for repository, namespace in repositories
+    ]
+    styles = item.get_styles()
+    assert item.get_styles_detail(style_references=styles) == [
+        item.get_style(style_reference=style, namespace_reference=namespace) for style, namespace in styles
+    ]
+    layers = item.get_layers()
+    assert item.get_layers_detail(layer_references=layers) == [
+        item.get_layer(layer_reference=layer) for layer in layers
+    ]
+    layer_groups = item.get_layer_groups()
+    assert item.get_layer_groups_detail(layer_group_references=layer_groups) == [
+        item.get_layer_group(layer_group_reference=layer_group, namespace_reference=namespace)
+        for layer_group, namespace in layer_groups
+    ]
+
+
+@pytest.mark.usefixtures('patched_geoserver')
+def test_geoserver_component_details_order(patched_geoserver):
+    item = GeoServer(**test_geoserver_data)
+    data = deepcopy(test_geoserver_catalogue_data)
+    data['workspaces'] = [{'name': f"test-namespace-{index}"} for index in range(1, 6)]
+    # These `populate()` methods are only defined in mock classes
+    # noinspection PyUnresolvedReferences
+    item.client.populate(data=data)
+
+    references = ['test-namespace-3', 'test-namespace-1', 'test-namespace-5', 'test-namespace-2', 'test-namespace-4']
+    result = item.get_namespaces_detail(namespace_references=references)
+    assert [namespace['label'] for namespace in result] == references
+
+    # Later references finish first, results should still be in the order of the references given
+    def _slow_method(index: int) -> int:
+        sleep((5 - index) * 0.01)
+        return index
+
+    assert item._get_details(method=_slow_method, references=[{'index': index} for index in range(5)]) == [
+        0, 1, 2, 3, 4
+    ]
+
+
+@pytest.mark.usefixtures('patched_geoserver')
+def test_geoserver_component_details_error(patched_geoserver):
+    item = GeoServer(**test_geoserver_data)
+    # These `populate()` methods are only defined in mock classes
+    # noinspection PyUnresolvedReferences
+    item.client.populate(data=test_geoserver_catalogue_data)
+
+    with pytest.raises(KeyError) as e:
+        item.get_namespaces_detail(
+            namespace_references=['test-namespace-1', 'invalid-namespace-1', 'invalid-namespace-2']
         )
-        assert result is not None
-        assert result['layer_labels'][0] == ('test-layer-1', 'test-namespace-1')
+    assert 'Namespace [invalid-namespace-1] not found in server [test-server-1]' in str(e.value)
@@ -1,5 +1,6 @@
 import pytest
 
+from functools import lru_cache
 from unittest.mock import patch
 from typing import List, Dict
 from pathlib import Path
@@ -22,6 +23,20 @@ def make_geoserver_server(server_config: Dict[str, str]):
     return geoserver
 
 
+@lru_cache(maxsize=None)
+def _validate_ogc_capabilities_cached(
+    ogc_protocol: OGCProtocol,
+    capabilities_url: str,
+    multiple_errors: bool
+) -> tuple:
+    # Validation results for test resources don't change, so each resource is only parsed and validated once per run
+    return tuple(_validate_ogc_capabilities(
+        ogc_protocol=ogc_protocol,
+        capabilities_url=capabilities_url,
+        multiple_errors=multiple_errors
+    ))
+
+
 # noinspection PyUnusedLocal
 def validate_ogc_capabilities_valid(
     ogc_protocol:
@@ -30,11 +45,11 @@ def validate_ogc_capabilities_valid(
     multiple_errors: bool
 ) -> List[str]:
     capabilities_url = 'tests/resources/validate_ogc_capabilities/wms-1.3.0-valid.xml'
-    return _validate_ogc_capabilities(
+    return list(_validate_ogc_capabilities_cached(
         ogc_protocol=ogc_protocol,
         capabilities_url=capabilities_url,
         multiple_errors=multiple_errors
-    )
+    ))
 
 
 # noinspection PyUnusedLocal
@@ -45,11 +60,11 @@ def validate_ogc_capabilities_invalid(
     multiple_errors: bool
 ) -> List[str]:
     capabilities_url = 'tests/resources/validate_ogc_capabilities/wms-1.3.0-invalid-multiple-invalid-extent.xml'
-    return _validate_ogc_capabilities(
+    return list(_validate_ogc_capabilities_cached(
         ogc_protocol=ogc_protocol,
         capabilities_url=capabilities_url,
         multiple_errors=multiple_errors
-    )
+    ))
 
 
 def prompt_all_data_sources(questions: List):
@@ -158,7 +173,7 @@ def test_data_validate_command_invalid_single_source_wms(app, app_runner):
 
 @pytest.mark.usefixtures('app', 'app_runner')
 def test_data_validate_command_valid_single_source_interactive_data_source_all(app, app_runner):
-    with patch('bas_web_map_inventory.cli.inquirer.prompt', side_effect=prompt_all_data_sources), \
+    with patch('inquirer.prompt', side_effect=prompt_all_data_sources), \
             patch('bas_web_map_inventory.cli.validate_ogc_capabilities', side_effect=validate_ogc_capabilities_valid):
 
         result = app_runner.invoke(
@@ -176,7 +191,7 @@ def test_data_validate_command_valid_single_source_interactive_data_source_all(a
 
 @pytest.mark.usefixtures('app', 'app_runner')
 def test_data_validate_command_valid_single_source_interactive_data_source_single(app, app_runner):
-    with patch('bas_web_map_inventory.cli.inquirer.prompt', side_effect=prompt_single_data_source), \
+    with patch('inquirer.prompt', side_effect=prompt_single_data_source), \
             patch('bas_web_map_inventory.cli.validate_ogc_capabilities', side_effect=validate_ogc_capabilities_valid):
 
         result = app_runner.invoke(
@@ -194,7 +209,7 @@ def test_data_validate_command_valid_single_source_interactive_data_source_singl
 
 @pytest.mark.usefixtures('app', 'app_runner')
 def test_data_validate_command_valid_single_source_interactive_data_source_aborted(app, app_runner):
-    with patch('bas_web_map_inventory.cli.inquirer.prompt', side_effect=prompt_aborted):
+    with patch('inquirer.prompt', side_effect=prompt_aborted):
 
         result = app_runner.invoke(
             args=[
@@ -210,7 +225,7 @@ def test_data_validate_command_valid_single_source_interactive_data_source_abort
 
 @pytest.mark.usefixtures('app', 'app_runner')
 def test_data_validate_command_valid_single_source_interactive_protocol_invalid(app, app_runner):
-    with patch('bas_web_map_inventory.cli.inquirer.prompt', side_effect=prompt_invalid_protocol):
+    with patch('inquirer.prompt', side_effect=prompt_invalid_protocol):
         result = app_runner.invoke(
             args=[
                 'data',
@@ -228,7 +243,7 @@ def test_data_validate_command_valid_single_source_interactive_protocol_invalid(
 
 @pytest.mark.usefixtures('app', 'app_runner')
 def test_data_validate_command_valid_single_source_interactive_protocol_aborted(app, app_runner):
-    with patch('bas_web_map_inventory.cli.inquirer.prompt', side_effect=prompt_aborted):
+    with patch('inquirer.prompt', side_effect=prompt_aborted):
         result = app_runner.invoke(
             args=[
                 'data',
@@ -262,27 +277,20 @@ def test_data_validate_command_valid_single_source_missing_protocol_endpoint(app
     assert str(result.exception) == '"Property \'wms-path\' not in data source [01DRS53XAG5E85MJNYTA6WPTBM]"'
 
 
-@pytest.mark.usefixtures('app', 'app_runner', 'geoserver_catalogue', 'wms_client', 'wfs_client')
-def test_data_fetch_command(app, app_runner, geoserver_catalogue, wms_client, wfs_client):
-    with patch('bas_web_map_inventory.components.geoserver.Catalogue') as mock_geoserver_catalogue, \
-            patch('bas_web_map_inventory.components.geoserver.WebMapService') as mock_wms_client, \
-            patch('bas_web_map_inventory.components.geoserver.WebFeatureService') as mock_wfs_client, \
-            patch('bas_web_map_inventory.cli._make_geoserver_server', side_effect=make_geoserver_server), \
+@pytest.mark.usefixtures('app', 'app_runner', 'patched_geoserver')
+def test_data_fetch_command(app, app_runner, patched_geoserver, tmp_path):
+    with patch('bas_web_map_inventory.cli._make_geoserver_server', side_effect=make_geoserver_server), \
             patch('bas_web_map_inventory.cli.validate_ogc_capabilities', side_effect=validate_ogc_capabilities_valid):
-        mock_geoserver_catalogue.return_value = geoserver_catalogue
-        mock_wms_client.return_value = wms_client
-        mock_wfs_client.return_value = wfs_client
-
         result = app_runner.invoke(
-            args=['data', 'fetch', '-s', 'tests/data/sources.json', '-d', 'tests/data/data-ok.json'])
+            args=['data', 'fetch', '-s', 'tests/data/sources.json', '-d', str(tmp_path / 'data-ok.json')])
         assert result.exit_code == 0
-        assert 'data' in app.config.keys()
-        assert 'servers' in app.config['data'].keys()
-        assert 'namespaces' in app.config['data'].keys()
-        assert 'repositories' in app.config['data'].keys()
-        assert 'styles' in app.config['data'].keys()
-        assert 'layers' in app.config['data'].keys()
-        assert 'layer_groups' in app.config['data'].keys()
+        assert 'data' in app.config
+        assert 'servers' in app.config['data']
+        assert 'namespaces' in app.config['data']
+        assert 'repositories' in app.config['data']
+        assert 'styles' in app.config['data']
+        assert 'layers' in app.config['data']
+        assert 'layer_groups' in app.config['data']
         assert len(app.config['data']['servers']) >= 1
         assert len(app.config['data']['namespaces']) >= 1
         assert len(app.config['data']['repositories']) >= 1
@@ -293,19 +301,12 @@ def test_data_fetch_command(app, app_runner, geoserver_catalogue, wms_client, wf
         assert 'Fetch complete' in result.output
 
 
-@pytest.mark.usefixtures('app', 'app_runner', 'geoserver_catalogue', 'wms_client', 'wfs_client')
-def test_data_fetch_command_invalid_wms(app, app_runner, geoserver_catalogue, wms_client, wfs_client):
-    with patch('bas_web_map_inventory.components.geoserver.Catalogue') as mock_geoserver_catalogue, \
-            patch('bas_web_map_inventory.components.geoserver.WebMapService') as mock_wms_client, \
-            patch('bas_web_map_inventory.components.geoserver.WebFeatureService') as mock_wfs_client, \
-            patch('bas_web_map_inventory.cli._make_geoserver_server', side_effect=make_geoserver_server), \
+@pytest.mark.usefixtures('app', 'app_runner', 'patched_geoserver')
+def test_data_fetch_command_invalid_wms(app, app_runner, patched_geoserver, tmp_path):
+    with patch('bas_web_map_inventory.cli._make_geoserver_server', side_effect=make_geoserver_server), \
             patch('bas_web_map_inventory.cli.validate_ogc_capabilities', side_effect=validate_ogc_capabilities_invalid):
-        mock_geoserver_catalogue.return_value = geoserver_catalogue
-        mock_wms_client.return_value = wms_client
-        mock_wfs_client.return_value = wfs_client
-
         result = app_runner.invoke(
-            args=['data', 'fetch', '-s', 'tests/data/sources.json', '-d', 'tests/data/data-invalid-wms.json'])
+            args=['data', 'fetch', '-s', 'tests/data/sources.json', '-d', str(tmp_path / 'data-invalid-wms.json')])
         assert result.exit_code == 0
         assert f"data sources in {str(Path('tests/data/sources.json').absolute())} have valid syntax" in result.output
         assert '* WMS endpoint invalid, server [test-server-1] skipped' in result.output
@@ -30,3 +30,10 @@ def wms_client():
 @pytest.fixture
 def wfs_client():
     return MockWFSClient()
+
+
+@pytest.fixture
+def patched_geoserver(monkeypatch, geoserver_catalogue, wms_client, wfs_client):
+    monkeypatch.setattr('geoserver.catalog.Catalog', lambda *args, **kwargs: geoserver_catalogue)
+    monkeypatch.setattr('owslib.wms.WebMapService', lambda *args, **kwargs: wms_client)
+    monkeypatch.setattr('owslib.wfs.WebFeatureService', lambda *args, **kwargs: wfs_client)